@@ -13,10 +13,10 @@ setup(
         "opencv-python-headless>=4.9.0",
         "hidapi>=0.14.0",
         "numpy>=1.26.0",
-        "scipy>=1.12.0",
     ],
     extras_require={
-        "ai": ["anthropic>=0.40.0"],
+        "ai": ["anthropic>=0.40.0", "av>=12.0.0"],
+        "fast": ["numba>=0.59.0", "av>=12.0.0"],
         "package": ["py2app>=0.28.0"],
     },
     entry_points={
@@ -9,21 +9,83 @@ Uses Anthropic's Claude API to analyze golf swings through:
 All analysis runs asynchronously (via QThread) to keep the UI responsive.
 """
 
+import asyncio
 import base64
+import hashlib
 import json
 import logging
-from statistics import mean, stdev
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
 
 import cv2
+import numpy as np
 import anthropic
 
+try:
+    import av
+except ImportError:  # PyAV is optional; OpenCV seek+decode is the fallback
+    av = None
+
 from src.models.shot import Shot
 from src.database.db import Database
+from src.utils.video import open_capture
 
 logger = logging.getLogger(__name__)
 
-MODEL = "claude-sonnet-4-20250514"
+# Sonnet for multimodal swing analysis where vision quality matters;
+# Haiku for short text-only prompts (data-only, session, trends).
+MODEL_VISION = "claude-sonnet-4-20250514"
+MODEL_TEXT = "claude-3-5-haiku-20241022"
+
+# Stable instructions sent as system blocks, kept out of the per-call user
+# content. They are far below the API's minimum cacheable prefix (1024+
+# tokens), so they carry no cache_control markers.
+COACH_SYSTEM_PROMPT = (
+    "You are a PGA-certified golf coach reviewing data from an OptiShot 2 "
+    "launch monitor.\n\n"
+    "Conventions: speeds are in mph and distances in yards. Face angle and "
+    "club path are in degrees; positive face angle = open, positive path = "
+    "in-to-out. Face-to-path determines curvature (positive = fade/slice, "
+    "negative = draw/hook).\n\n"
+    "Be direct and actionable, not generic."
+)
+
+SWING_RUBRIC = (
+    "For per-swing video analysis you receive four labeled key frames "
+    "(address, top of backswing, impact, follow-through) followed by the "
+    "launch monitor data.\n\n"
+    "Based on the video frames and data:\n"
+    "1. What is the golfer doing well?\n"
+    "2. What is the primary swing fault visible in the video?\n"
+    "3. Give ONE specific drill or feel to fix it.\n\n"
+    "Be concise and specific. Reference what you see in the frames."
+)
+
+COACH_SYSTEM = [
+    {"type": "text", "text": COACH_SYSTEM_PROMPT},
+]
+SWING_SYSTEM = [
+    {"type": "text", "text": COACH_SYSTEM_PROMPT},
+    {"type": "text", "text": SWING_RUBRIC},
+]
+
+# Maximum number of responses kept in the in-memory cache
+RESPONSE_CACHE_SIZE = 256
+
+# Key frame positions through a swing clip: address, top of backswing,
+# impact, follow-through
+KEY_FRAME_POSITIONS = [0.10, 0.35, 0.50, 0.75]
+
+# Key frames are downscaled before upload; image tokens scale with area.
+KEY_FRAME_SIZE = (512, 384)
+
+# Optimized Huffman tables shrink the JPEG for negligible encode cost
+JPEG_ENCODE_PARAMS = [
+    cv2.IMWRITE_JPEG_QUALITY, 80,
+    cv2.IMWRITE_JPEG_OPTIMIZE, 1,
+    cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+]
 
 
 class AISwingCoach:
@@ -46,11 +108,16 @@ class AISwingCoach:
         """
         if api_key:
             self.client = anthropic.Anthropic(api_key=api_key)
+            self.async_client = anthropic.AsyncAnthropic(api_key=api_key)
         else:
             self.client = anthropic.Anthropic()  # Uses env var
+            self.async_client = anthropic.AsyncAnthropic()
         self.db = db
+        # In-memory LRU of recent responses, keyed by request hash
+        self._response_cache: OrderedDict[str, str] = OrderedDict()
 
-    def analyze_swing(self, shot: Shot) -> str:
+    def analyze_swing(self, shot: Shot,
+                      on_text: Optional[Callable[[str], None]] = None) -> str:
         """Analyze a single swing using video frames + shot data.
 
         Extracts 4 key frames from the swing video (address, top of
@@ -61,65 +128,22 @@ class AISwingCoach:
 
         Args:
             shot: Complete shot record with club data and optionally video.
+            on_text: Optional callback receiving response text as it
+                streams in (e.g. a Qt signal's emit). Called from the
+                calling thread; cached responses arrive as one chunk.
 
         Returns:
             Coaching feedback text from Claude.
         """
         if not shot.video_path:
-            return self._analyze_data_only(shot)
+            return self._analyze_data_only(shot, on_text)
 
         frames = self._extract_key_frames(shot.video_path)
         if not frames:
-            return self._analyze_data_only(shot)
-
-        # Build multimodal content with labeled frames
-        content = []
-        labels = ["Address", "Top of backswing", "Impact", "Follow-through"]
-
-        for frame, label in zip(frames, labels):
-            b64 = self._frame_to_base64(frame)
-            content.append({"type": "text", "text": f"**{label}:**"})
-            content.append({
-                "type": "image",
-                "source": {
-                    "type": "base64",
-                    "media_type": "image/jpeg",
-                    "data": b64,
-                },
-            })
+            return self._analyze_data_only(shot, on_text)
 
-        cd = shot.club_data
-        bl = shot.ball_launch
-        face_label = "open" if cd.face_angle_deg > 0 else "closed"
-        path_label = "in-to-out" if cd.path_deg > 0 else "out-to-in"
-
-        content.append({
-            "type": "text",
-            "text": (
-                f"Analyze this golf swing. Shot data from the launch monitor:\n\n"
-                f"Club: {cd.club_type}\n"
-                f"Club Speed: {cd.club_speed_mph} mph\n"
-                f"Face Angle: {cd.face_angle_deg}° ({face_label})\n"
-                f"Club Path: {cd.path_deg}° ({path_label})\n"
-                f"Face-to-Path: {cd.face_angle_deg - cd.path_deg:.1f}°\n"
-                f"Carry Distance: {shot.carry_yards} yards\n"
-                f"Shot Shape: {shot.shot_shape}\n\n"
-                f"Based on the video frames and data:\n"
-                f"1. What is the golfer doing well?\n"
-                f"2. What is the primary swing fault visible in the video?\n"
-                f"3. Give ONE specific drill or feel to fix it.\n\n"
-                f"Be concise and specific. Reference what you see in the frames."
-            ),
-        })
-
-        response = self.client.messages.create(
-            model=MODEL,
-            max_tokens=600,
-            messages=[{"role": "user", "content": content}],
-        )
-
-        feedback = response.content[0].text
-        tokens = response.usage.input_tokens + response.usage.output_tokens
+        params, prompt = self._build_shot_request(shot, frames)
+        feedback, tokens = self._complete(params, on_text)
 
         # Persist to database
         if self.db and shot.id:
@@ -127,34 +151,19 @@ class AISwingCoach:
                 shot_id=shot.id,
                 session_id=shot.session_id,
                 feedback_type="per_shot",
-                prompt="(video + data analysis)",
+                prompt=prompt,
                 response=feedback,
-                model=MODEL,
+                model=params["model"],
                 tokens=tokens,
             )
 
         return feedback
 
-    def _analyze_data_only(self, shot: Shot) -> str:
+    def _analyze_data_only(self, shot: Shot,
+                           on_text: Optional[Callable[[str], None]] = None) -> str:
         """Fallback: analyze shot data without video frames."""
-        cd = shot.club_data
-        prompt = (
-            f"You are a PGA-certified golf coach. Analyze this shot:\n\n"
-            f"Club: {cd.club_type}, Speed: {cd.club_speed_mph}mph\n"
-            f"Face: {cd.face_angle_deg}°, Path: {cd.path_deg}°\n"
-            f"Face-to-Path: {cd.face_angle_deg - cd.path_deg:.1f}°\n"
-            f"Carry: {shot.carry_yards}yd, Shape: {shot.shot_shape}\n\n"
-            f"What does this data suggest about the swing? "
-            f"Give one specific tip to improve."
-        )
-        response = self.client.messages.create(
-            model=MODEL,
-            max_tokens=300,
-            messages=[{"role": "user", "content": prompt}],
-        )
-
-        feedback = response.content[0].text
-        tokens = response.usage.input_tokens + response.usage.output_tokens
+        params, prompt = self._build_shot_request(shot, [])
+        feedback, tokens = self._complete(params, on_text)
 
         if self.db and shot.id:
             self.db.save_ai_feedback(
@@ -163,7 +172,7 @@ class AISwingCoach:
                 feedback_type="per_shot",
                 prompt=prompt,
                 response=feedback,
-                model=MODEL,
+                model=params["model"],
                 tokens=tokens,
             )
 
@@ -185,50 +194,47 @@ class AISwingCoach:
         if len(shots) < 3:
             return "Need at least 3 shots for session analysis."
 
-        speeds = [s.club_data.club_speed_mph for s in shots]
-        faces = [s.club_data.face_angle_deg for s in shots]
-        paths = [s.club_data.path_deg for s in shots]
-        carries = [s.carry_yards for s in shots if s.carry_yards > 0]
-        laterals = [s.lateral_yards for s in shots]
+        # One (N, 5) array: speed, face, path, carry, lateral
+        arr = np.array([
+            (s.club_data.club_speed_mph, s.club_data.face_angle_deg,
+             s.club_data.path_deg, s.carry_yards, s.lateral_yards)
+            for s in shots
+        ], dtype=np.float64)
+        speeds, faces, paths, carries, laterals = arr.T
+        carries = carries[carries > 0]
 
         stats = {
             "club": shots[0].club_data.club_type,
             "num_shots": len(shots),
-            "avg_club_speed": round(mean(speeds), 1),
-            "std_club_speed": round(stdev(speeds), 1) if len(speeds) > 1 else 0,
-            "avg_face_angle": round(mean(faces), 1),
-            "std_face_angle": round(stdev(faces), 1) if len(faces) > 1 else 0,
-            "avg_path": round(mean(paths), 1),
-            "avg_carry": round(mean(carries), 1) if carries else 0,
-            "std_carry": round(stdev(carries), 1) if len(carries) > 1 else 0,
-            "miss_left_pct": round(
-                sum(1 for l in laterals if l < -5) / len(laterals) * 100
-            ),
-            "miss_right_pct": round(
-                sum(1 for l in laterals if l > 5) / len(laterals) * 100
+            "avg_club_speed": round(float(speeds.mean()), 1),
+            "std_club_speed": round(float(speeds.std(ddof=1)), 1),
+            "avg_face_angle": round(float(faces.mean()), 1),
+            "std_face_angle": round(float(faces.std(ddof=1)), 1),
+            "avg_path": round(float(paths.mean()), 1),
+            "avg_carry": round(float(carries.mean()), 1) if carries.size else 0,
+            "std_carry": (
+                round(float(carries.std(ddof=1)), 1) if carries.size > 1 else 0
             ),
+            "miss_left_pct": round(float((laterals < -5).mean()) * 100),
+            "miss_right_pct": round(float((laterals > 5).mean()) * 100),
         }
 
         prompt = (
-            f"You are a PGA-certified golf coach. "
             f"Analyze this practice session data:\n\n"
             f"{json.dumps(stats, indent=2)}\n\n"
             f"Provide:\n"
             f"1. The primary consistency issue you see\n"
             f"2. What this pattern usually indicates about the swing\n"
             f"3. Two specific practice drills to address it\n"
-            f"4. What to focus on next session\n\n"
-            f"Be direct and actionable, not generic."
-        )
-
-        response = self.client.messages.create(
-            model=MODEL,
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}],
+            f"4. What to focus on next session"
         )
 
-        feedback = response.content[0].text
-        tokens = response.usage.input_tokens + response.usage.output_tokens
+        feedback, tokens = self._complete({
+            "model": MODEL_TEXT,
+            "max_tokens": 500,
+            "system": COACH_SYSTEM,
+            "messages": [{"role": "user", "content": prompt}],
+        })
 
         if self.db and shots[0].session_id:
             self.db.save_ai_feedback(
@@ -237,7 +243,7 @@ class AISwingCoach:
                 feedback_type="session",
                 prompt=prompt,
                 response=feedback,
-                model=MODEL,
+                model=MODEL_TEXT,
                 tokens=tokens,
             )
 
@@ -257,8 +263,8 @@ class AISwingCoach:
             return "Need at least 2 sessions for trend analysis."
 
         prompt = (
-            f"You are a PGA-certified golf coach tracking a student's "
-            f"progress over {len(session_summaries)} practice sessions.\n\n"
+            f"Track this student's progress over "
+            f"{len(session_summaries)} practice sessions.\n\n"
             f"Session data (oldest to newest):\n"
             f"{json.dumps(session_summaries, indent=2)}\n\n"
             f"Provide:\n"
@@ -268,12 +274,327 @@ class AISwingCoach:
             f"Be data-driven and reference specific numbers."
         )
 
-        response = self.client.messages.create(
-            model=MODEL,
-            max_tokens=500,
-            messages=[{"role": "user", "content": prompt}],
+        feedback, _ = self._complete({
+            "model": MODEL_TEXT,
+            "max_tokens": 500,
+            "system": COACH_SYSTEM,
+            "messages": [{"role": "user", "content": prompt}],
+        })
+        return feedback
+
+    def analyze_shots_batch(self, shots: list[Shot],
+                            poll_interval: float = 5.0,
+                            max_poll_interval: float = 60.0) -> list[str]:
+        """Analyze many shots at once through the Message Batches API.
+
+        Intended for non-interactive work such as re-analyzing a whole
+        session. Batched requests are billed at 50% and processed in
+        parallel server-side, at the cost of waiting for the batch to
+        finish. Use analyze_swing for the interactive single-shot case.
+
+        Args:
+            shots: Shots to analyze (video + data, or data only).
+            poll_interval: Initial seconds between batch status checks.
+            max_poll_interval: Upper bound for the exponential backoff.
+
+        Returns:
+            Feedback text per shot, in the same order as `shots`.
+            Shots whose request did not succeed get an empty string.
+        """
+        if not shots:
+            return []
+
+        requests = []
+        prompts = {}
+        for i, shot in enumerate(shots):
+            custom_id = f"shot-{i}"
+            frames = (
+                self._extract_key_frames(shot.video_path)
+                if shot.video_path else []
+            )
+            params, prompts[custom_id] = self._build_shot_request(shot, frames)
+            requests.append({"custom_id": custom_id, "params": params})
+
+        batch = self.client.messages.batches.create(requests=requests)
+        logger.info(f"Submitted analysis batch {batch.id} ({len(requests)} shots)")
+
+        delay = poll_interval
+        while batch.processing_status != "ended":
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = self.client.messages.batches.retrieve(batch.id)
+
+        feedback_by_id = {}
+        for entry in self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.warning(
+                    f"Batch request {entry.custom_id} {entry.result.type}"
+                )
+                continue
+
+            message = entry.result.message
+            feedback = message.content[0].text
+            tokens = message.usage.input_tokens + message.usage.output_tokens
+            feedback_by_id[entry.custom_id] = feedback
+
+            shot = shots[int(entry.custom_id.split("-")[1])]
+            if self.db and shot.id:
+                self.db.save_ai_feedback(
+                    shot_id=shot.id,
+                    session_id=shot.session_id,
+                    feedback_type="per_shot",
+                    prompt=prompts[entry.custom_id],
+                    response=feedback,
+                    model=message.model,
+                    tokens=tokens,
+                )
+
+        return [feedback_by_id.get(f"shot-{i}", "") for i in range(len(shots))]
+
+    async def analyze_many(self, shots: list[Shot],
+                           max_concurrency: int = 8) -> list[str]:
+        """Analyze many shots concurrently with the async client.
+
+        Requests overlap on the network (up to `max_concurrency` in
+        flight), so wall-clock time is roughly that of the slowest request
+        rather than the sum. Identical requests are answered from the
+        response cache, as in analyze_swing. Feedback is persisted in one
+        bulk insert once all requests finish. A failed request is logged
+        and does not discard the others. Call from a worker QThread via
+        `asyncio.run(coach.analyze_many(shots))`.
+
+        Args:
+            shots: Shots to analyze (video + data, or data only).
+            max_concurrency: Maximum simultaneous API requests.
+
+        Returns:
+            Feedback text per shot, in the same order as `shots` ("" for
+            shots whose request failed).
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+        outcomes = await asyncio.gather(
+            *(self._aanalyze_swing(shot, sem) for shot in shots),
+            return_exceptions=True,
+        )
+
+        results = []
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    f"AI analysis failed for shot {i}: {outcome!r}",
+                    exc_info=outcome,
+                )
+                outcome = ("", 0, "", "")
+            results.append(outcome)
+
+        if self.db:
+            self.db.save_ai_feedback_many([
+                {
+                    "shot_id": shot.id,
+                    "session_id": shot.session_id,
+                    "feedback_type": "per_shot",
+                    "prompt": prompt,
+                    "response": feedback,
+                    "model": model,
+                    "tokens": tokens,
+                }
+                for shot, (feedback, tokens, prompt, model) in zip(shots, results)
+                if shot.id and feedback
+            ])
+
+        return [feedback for feedback, _, _, _ in results]
+
+    async def _aanalyze_swing(self, shot: Shot,
+                              sem: asyncio.Semaphore) -> tuple[str, int, str, str]:
+        """Async counterpart of analyze_swing (without persistence).
+
+        Returns:
+            Tuple of (feedback, tokens used, prompt stored with feedback,
+            model name).
+        """
+        frames = []
+        if shot.video_path:
+            frames = await asyncio.to_thread(
+                self._extract_key_frames, shot.video_path
+            )
+        params, prompt = self._build_shot_request(shot, frames)
+
+        key = self._cache_key(params)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached, 0, prompt, params["model"]
+
+        async with sem:
+            response = await self.async_client.messages.create(**params)
+        self._log_usage(response)
+
+        feedback = response.content[0].text
+        tokens = response.usage.input_tokens + response.usage.output_tokens
+        self._store_response(key, params["model"], feedback, tokens)
+        return feedback, tokens, prompt, params["model"]
+
+    # =========================================================================
+    # Prompt builders
+    # =========================================================================
+
+    def _build_shot_request(self, shot: Shot, frames: list) -> tuple[dict, str]:
+        """Build messages.create parameters for a per-shot analysis.
+
+        Uses the video rubric when key frames are available, otherwise
+        the data-only prompt.
+
+        Returns:
+            Tuple of (request params, prompt text to store with feedback).
+        """
+        if frames:
+            content = self._build_swing_content(shot, frames)
+            params = {
+                "model": MODEL_VISION,
+                "max_tokens": 600,
+                "system": SWING_SYSTEM,
+                "messages": [{"role": "user", "content": content}],
+            }
+            return params, "(video + data analysis)"
+
+        prompt = self._build_data_only_prompt(shot)
+        params = {
+            "model": MODEL_TEXT,
+            "max_tokens": 300,
+            "system": COACH_SYSTEM,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        return params, prompt
+
+    def _build_swing_content(self, shot: Shot, frames: list) -> list[dict]:
+        """Build multimodal message content: labeled key frames + shot data."""
+        content = []
+        labels = ["Address", "Top of backswing", "Impact", "Follow-through"]
+
+        for frame, label in zip(frames, labels):
+            b64 = self._frame_to_base64(frame)
+            content.append({"type": "text", "text": f"**{label}:**"})
+            content.append({
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": "image/jpeg",
+                    "data": b64,
+                },
+            })
+
+        cd = shot.club_data
+        face_label = "open" if cd.face_angle_deg > 0 else "closed"
+        path_label = "in-to-out" if cd.path_deg > 0 else "out-to-in"
+
+        content.append({
+            "type": "text",
+            "text": (
+                f"Analyze this golf swing. Shot data from the launch monitor:\n\n"
+                f"Club: {cd.club_type}\n"
+                f"Club Speed: {cd.club_speed_mph} mph\n"
+                f"Face Angle: {cd.face_angle_deg}° ({face_label})\n"
+                f"Club Path: {cd.path_deg}° ({path_label})\n"
+                f"Face-to-Path: {cd.face_angle_deg - cd.path_deg:.1f}°\n"
+                f"Carry Distance: {shot.carry_yards} yards\n"
+                f"Shot Shape: {shot.shot_shape}"
+            ),
+        })
+        return content
+
+    def _build_data_only_prompt(self, shot: Shot) -> str:
+        """Build the text-only prompt for a single shot."""
+        cd = shot.club_data
+        return (
+            f"Analyze this shot:\n\n"
+            f"Club: {cd.club_type}, Speed: {cd.club_speed_mph}mph\n"
+            f"Face: {cd.face_angle_deg}°, Path: {cd.path_deg}°\n"
+            f"Face-to-Path: {cd.face_angle_deg - cd.path_deg:.1f}°\n"
+            f"Carry: {shot.carry_yards}yd, Shape: {shot.shot_shape}\n\n"
+            f"What does this data suggest about the swing? "
+            f"Give one specific tip to improve."
+        )
+
+    def _complete(self, params: dict,
+                  on_text: Optional[Callable[[str], None]] = None) -> tuple[str, int]:
+        """Call messages.create, short-circuiting identical requests.
+
+        Responses are keyed by a BLAKE2 hash of the full request (model,
+        max_tokens, system blocks and message content, including base64
+        image data). Lookups go to an in-memory LRU first, then to the
+        database's ai_cache table so hits survive restarts.
+
+        When on_text is given, cache misses use messages.stream and pass
+        each text delta to it as it arrives; hits pass the whole response.
+
+        Returns:
+            Tuple of (feedback text, tokens used). Cache hits report 0 tokens.
+        """
+        key = self._cache_key(params)
+        cached = self._cached_response(key)
+        if cached is not None:
+            if on_text:
+                on_text(cached)
+            return cached, 0
+
+        if on_text:
+            with self.client.messages.stream(**params) as stream:
+                for text in stream.text_stream:
+                    on_text(text)
+                response = stream.get_final_message()
+        else:
+            response = self.client.messages.create(**params)
+        self._log_usage(response)
+
+        feedback = response.content[0].text
+        tokens = response.usage.input_tokens + response.usage.output_tokens
+        self._store_response(key, params["model"], feedback, tokens)
+        return feedback, tokens
+
+    @staticmethod
+    def _cache_key(params: dict) -> str:
+        """BLAKE2 hash of a full request, used as the response cache key."""
+        return hashlib.blake2b(
+            json.dumps(params, sort_keys=True).encode("utf-8"),
+            digest_size=32,
+        ).hexdigest()
+
+    def _cached_response(self, key: str) -> Optional[str]:
+        """Look a response up in the in-memory LRU, then the database."""
+        cache = self._response_cache
+        if key in cache:
+            cache.move_to_end(key)
+            logger.debug(f"AI response cache hit (memory): {key[:12]}")
+            return cache[key]
+        if self.db:
+            cached = self.db.get_cached_response(key)
+            if cached is not None:
+                logger.debug(f"AI response cache hit (disk): {key[:12]}")
+                self._remember(key, cached)
+                return cached
+        return None
+
+    def _store_response(self, key: str, model: str, feedback: str,
+                        tokens: int):
+        """Cache a fresh response in memory and in the database."""
+        self._remember(key, feedback)
+        if self.db:
+            self.db.save_cached_response(key, model, feedback, tokens)
+
+    def _remember(self, key: str, feedback: str):
+        """Insert a response into the in-memory LRU, evicting the oldest."""
+        cache = self._response_cache
+        cache[key] = feedback
+        cache.move_to_end(key)
+        if len(cache) > RESPONSE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _log_usage(self, response):
+        """Log token usage for cost tracking."""
+        usage = response.usage
+        logger.debug(
+            f"Token usage: input={usage.input_tokens} "
+            f"output={usage.output_tokens}"
         )
-        return response.content[0].text
 
     # =========================================================================
     # Frame extraction helpers
@@ -286,9 +607,57 @@ class AISwingCoach:
         Positions: 10%, 35%, 50%, 75% through the clip, corresponding
         roughly to address, top of backswing, impact, follow-through.
 
-        Frames are resized to 640x480 to reduce API token cost.
+        Uses PyAV keyframe seeks when available, falling back to OpenCV
+        for files PyAV cannot seek (e.g. missing duration/timestamps).
+
+        Frames are area-downscaled to KEY_FRAME_SIZE (to reduce API token
+        cost) into one preallocated (N, H, W, 3) uint8 batch; the returned
+        list holds views into it.
+        """
+        positions = KEY_FRAME_POSITIONS[:num_frames]
+        if av is not None:
+            try:
+                frames = self._extract_key_frames_av(video_path, positions)
+                if frames is not None:
+                    return frames
+            except (av.FFmpegError, OSError, ValueError) as e:
+                logger.debug(f"PyAV frame extraction failed, using OpenCV: {e}")
+
+        return self._extract_key_frames_cv2(video_path, positions)
+
+    def _extract_key_frames_av(self, video_path: str,
+                               positions: list[float]) -> Optional[list]:
+        """Extract frames by seeking to the nearest I-frame and decoding forward.
+
+        Returns None if the stream lacks the timing info needed to seek.
         """
-        cap = cv2.VideoCapture(video_path)
+        with av.open(video_path) as container:
+            stream = container.streams.video[0]
+            if not stream.duration:
+                return None
+            if 0 < stream.frames < 10:
+                return []
+
+            start = stream.start_time or 0
+            batch = _new_frame_batch(len(positions))
+            count = 0
+            for pos in positions:
+                target_pts = start + int(pos * stream.duration)
+                container.seek(target_pts, stream=stream, any_frame=False)
+                for frame in container.decode(stream):
+                    if frame.pts is None:
+                        return None
+                    if frame.pts >= target_pts:
+                        img = frame.to_ndarray(format="bgr24")
+                        _resize_into(img, batch[count])
+                        count += 1
+                        break
+            return list(batch[:count])
+
+    def _extract_key_frames_cv2(self, video_path: str,
+                                positions: list[float]) -> list:
+        """Extract frames with OpenCV frame-index seeks."""
+        cap = open_capture(video_path)
         if not cap.isOpened():
             logger.error(f"Cannot open video: {video_path}")
             return []
@@ -298,21 +667,30 @@ class AISwingCoach:
             cap.release()
             return []
 
-        positions = [0.10, 0.35, 0.50, 0.75]
-        frames = []
-        for pos in positions[:num_frames]:
+        batch = _new_frame_batch(len(positions))
+        count = 0
+        for pos in positions:
             cap.set(cv2.CAP_PROP_POS_FRAMES, int(total * pos))
             ret, frame = cap.read()
             if ret:
-                frame = cv2.resize(frame, (640, 480))
-                frames.append(frame)
+                _resize_into(frame, batch[count])
+                count += 1
 
         cap.release()
-        return frames
+        return list(batch[:count])
 
     def _frame_to_base64(self, frame) -> str:
         """Encode an OpenCV frame as base64 JPEG."""
-        _, buffer = cv2.imencode(
-            '.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 80]
-        )
-        return base64.b64encode(buffer).decode('utf-8')
+        _, buffer = cv2.imencode('.jpg', frame, JPEG_ENCODE_PARAMS)
+        return base64.b64encode(buffer).decode('ascii')
+
+
+def _new_frame_batch(n: int) -> np.ndarray:
+    """Allocate a contiguous (n, H, W, 3) BGR buffer for key frames."""
+    w, h = KEY_FRAME_SIZE
+    return np.empty((n, h, w, 3), dtype=np.uint8)
+
+
+def _resize_into(img: np.ndarray, dst: np.ndarray):
+    """Downscale a BGR frame into a preallocated KEY_FRAME_SIZE slot."""
+    cv2.resize(img, KEY_FRAME_SIZE, dst=dst, interpolation=cv2.INTER_AREA)
@@ -10,18 +10,19 @@ Physics based on:
   - cagrell/golfmodel — Python implementation reference
   - D-Plane model for face/path → launch direction and spin axis
 
-Uses scipy.integrate.solve_ivp for trajectory simulation with:
+Trajectory simulation uses a fixed-step RK4 integrator (Numba-compiled
+when available) with:
   - Gravitational force
   - Aerodynamic drag (Reynolds-number dependent)
   - Magnus lift (spin-dependent)
 """
 
+import functools
 import math
 import logging
 from typing import Optional
 
 import numpy as np
-from scipy.integrate import solve_ivp
 
 from src.models.shot import ClubData, BallLaunch, TrajectoryResult
 from src.utils.constants import (
@@ -38,13 +39,21 @@ from src.utils.constants import (
     YARDS_TO_METERS,
     RPM_TO_RAD_S,
     SPIN_TILT_FACTOR,
-    CLUB_LOFTS,
-    SMASH_FACTORS,
-    TYPICAL_BACKSPIN,
+    CLUB_SPECS,
+    ClubSpec,
+    GREEN_ROLL_DECEL,
+    MIN_SWING_SPEED_MPH,
+    MIN_LAUNCH_ANGLE_DEG,
 )
+from src.utils.jit import njit
 
 logger = logging.getLogger(__name__)
 
+# Properties assumed for a club name missing from CLUB_SPECS
+_DEFAULT_CLUB_SPEC = ClubSpec(
+    loft=30.0, smash=1.35, backspin=5000, pga_carry=None, pga_speed=None
+)
+
 
 # =============================================================================
 # Stage 1: Club Data → Ball Launch Conditions
@@ -66,17 +75,39 @@ def club_to_ball_launch(club_data: ClubData) -> BallLaunch:
     Returns:
         BallLaunch with estimated ball conditions.
     """
-    club = club_data.club_type
-    club_speed = club_data.club_speed_mph
-    face_angle = club_data.face_angle_deg
-    path = club_data.path_deg
+    if (club_data.club_type != "Putter"
+            and club_data.club_speed_mph < MIN_SWING_SPEED_MPH):
+        return BallLaunch(0.0, 0.0, 0.0, 0.0, 0.0)
+
+    values = _launch_values(
+        club_data.club_type,
+        round(club_data.club_speed_mph, 1),
+        round(club_data.face_angle_deg, 1),
+        round(club_data.path_deg, 1),
+    )
+    return BallLaunch(*values)
+
+
+@functools.lru_cache(maxsize=4096)
+def _launch_values(club: str, club_speed: float, face_angle: float,
+                   path: float) -> tuple[float, float, float, float, float]:
+    """Memoized core of club_to_ball_launch.
+
+    Sensor data is quantized to 0.1 mph / 0.1°, so repeated inputs are
+    common (re-opened shots, wind toggles). Returns plain values rather
+    than a BallLaunch so callers never share a mutable instance.
+
+    Returns:
+        Tuple of (ball_speed_mph, vla_deg, hla_deg, backspin_rpm,
+        spin_axis_deg).
+    """
+    spec = CLUB_SPECS.get(club, _DEFAULT_CLUB_SPEC)
 
     # Smash factor: how efficiently club speed transfers to ball speed
-    smash = SMASH_FACTORS.get(club, 1.35)
-    ball_speed = club_speed * smash
+    ball_speed = club_speed * spec.smash
 
     # Dynamic loft: static loft adjusted by face angle
-    base_loft = CLUB_LOFTS.get(club, 30.0)
+    base_loft = spec.loft
     dynamic_loft = base_loft + (face_angle * 0.7)
 
     # Vertical launch angle: percentage of dynamic loft
@@ -104,7 +135,7 @@ def club_to_ball_launch(club_data: ClubData) -> BallLaunch:
     face_to_path = face_angle - path
 
     # Backspin estimation
-    backspin = _estimate_backspin(ball_speed, dynamic_loft, club)
+    backspin = _estimate_backspin(ball_speed, dynamic_loft, spec)
 
     # Spin axis from face-to-path
     # Positive = tilted right (fade/slice), Negative = tilted left (draw/hook)
@@ -121,17 +152,17 @@ def club_to_ball_launch(club_data: ClubData) -> BallLaunch:
     # Clamp spin axis
     spin_axis = max(-45, min(45, spin_axis))
 
-    return BallLaunch(
-        ball_speed_mph=round(ball_speed, 1),
-        vla_deg=round(vla, 1),
-        hla_deg=round(hla, 1),
-        backspin_rpm=round(backspin),
-        spin_axis_deg=round(spin_axis, 1),
+    return (
+        round(ball_speed, 1),
+        round(vla, 1),
+        round(hla, 1),
+        round(backspin),
+        round(spin_axis, 1),
     )
 
 
 def _estimate_backspin(ball_speed_mph: float, dynamic_loft: float,
-                       club: str) -> float:
+                       spec: ClubSpec) -> float:
     """Estimate backspin RPM from ball speed and dynamic loft.
 
     Higher loft and lower ball speed → more backspin.
@@ -140,22 +171,21 @@ def _estimate_backspin(ball_speed_mph: float, dynamic_loft: float,
     Args:
         ball_speed_mph: Ball speed in mph.
         dynamic_loft: Dynamic loft at impact in degrees.
-        club: Club name string.
+        spec: Standard properties of the club.
 
     Returns:
         Estimated backspin in RPM.
     """
     # Base spin from club type
-    base_spin = TYPICAL_BACKSPIN.get(club, 5000)
+    base_spin = spec.backspin
 
     # Adjust for dynamic loft deviation from standard
-    standard_loft = CLUB_LOFTS.get(club, 30.0)
-    loft_delta = dynamic_loft - standard_loft
+    loft_delta = dynamic_loft - spec.loft
     spin_adjust = loft_delta * 200  # ~200 RPM per degree of added loft
 
     # Adjust for ball speed (faster = less spin for same club)
     # Normalized around typical amateur speeds
-    typical_speed = SMASH_FACTORS.get(club, 1.35) * 85  # rough amateur baseline
+    typical_speed = spec.smash * 85  # rough amateur baseline
     speed_ratio = ball_speed_mph / max(typical_speed, 1.0)
     speed_factor = 1.0 + (1.0 - speed_ratio) * 0.3  # ±30% adjustment
 
@@ -163,16 +193,99 @@ def _estimate_backspin(ball_speed_mph: float, dynamic_loft: float,
     return max(500, min(14000, backspin))  # Clamp to physical range
 
 
+def club_to_ball_launch_batch(
+    club_speeds, face_angles, paths, club_types,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Vectorized club_to_ball_launch over many swings at once.
+
+    Same model as club_to_ball_launch/_launch_values, evaluated on whole
+    arrays (e.g. for Monte Carlo fitting over thousands of swings).
+    Inputs and outputs are quantized like the scalar path, but with
+    np.round: it scales by 10**ndigits and rounds half to even, so a
+    value within float error of a decimal tie (e.g. 85 * 1.33) can land
+    one step (0.1, or 1 rpm for backspin) away from round()'s result.
+
+    Args:
+        club_speeds: Club speeds (mph).
+        face_angles: Face angles (degrees).
+        paths: Swing paths (degrees).
+        club_types: Club name per swing.
+
+    Returns:
+        Tuple of arrays (ball_speed_mph, vla_deg, hla_deg, backspin_rpm,
+        spin_axis_deg), one entry per swing.
+    """
+    raw_speed = np.asarray(club_speeds, dtype=np.float64)
+    club_speed = np.round(raw_speed, 1)
+    face_angle = np.round(np.asarray(face_angles, dtype=np.float64), 1)
+    path = np.round(np.asarray(paths, dtype=np.float64), 1)
+
+    # Per-club constants: one CLUB_SPECS lookup per distinct club
+    names, club_idx = np.unique(np.asarray(club_types, dtype=str),
+                                return_inverse=True)
+    specs = [CLUB_SPECS.get(name, _DEFAULT_CLUB_SPEC) for name in names]
+    smash = np.array([s.smash for s in specs])[club_idx]
+    base_loft = np.array([s.loft for s in specs])[club_idx]
+    base_spin = np.array([s.backspin for s in specs])[club_idx]
+    face_contrib = np.select(
+        [names == "Driver", names == "Putter"], [0.85, 0.90], 0.75
+    )[club_idx]
+
+    ball_speed = club_speed * smash
+    dynamic_loft = base_loft + face_angle * 0.7
+    vla = np.clip(dynamic_loft * (0.75 + base_loft / 200), 2.0, 55.0)
+    hla = face_angle * face_contrib + path * (1.0 - face_contrib)
+
+    # Backspin (see _estimate_backspin); always >= 500 after the clamp
+    typical_speed = np.maximum(smash * 85, 1.0)
+    speed_factor = 1.0 + (1.0 - ball_speed / typical_speed) * 0.3
+    backspin = np.clip(
+        (base_spin + (dynamic_loft - base_loft) * 200) * speed_factor,
+        500, 14000,
+    )
+    spin_axis = np.clip(np.degrees(np.arctan2(
+        (face_angle - path) * SPIN_TILT_FACTOR * backspin / 3000,
+        backspin / 1000,
+    )), -45, 45)
+
+    result = (
+        np.round(ball_speed, 1),
+        np.round(vla, 1),
+        np.round(hla, 1),
+        np.round(backspin, 0),
+        np.round(spin_axis, 1),
+    )
+
+    # Below MIN_SWING_SPEED_MPH there is no launch (putts excepted)
+    is_putter = names[club_idx] == "Putter"
+    no_swing = (raw_speed < MIN_SWING_SPEED_MPH) & ~is_putter
+    if no_swing.any():
+        for values in result:
+            values[no_swing] = 0.0
+    return result
+
+
 # =============================================================================
 # Stage 2: Trajectory Simulation (ODE Integration)
 # =============================================================================
 
+# Spin decay rate (exponential, ~1% per second)
+SPIN_DECAY_RATE = 0.01
+
+# Force constants hoisted out of the ODE right-hand side
+_TWO_PI_R = 2 * math.pi * BALL_RADIUS          # spin rev/s → surface speed
+_HALF_RHO_A = 0.5 * AIR_DENSITY * BALL_AREA    # dynamic pressure × area
+_INV_MASS = 1.0 / BALL_MASS
+
+
 def compute_trajectory(
     launch: BallLaunch,
     wind_speed_mph: float = 0.0,
     wind_direction_deg: float = 0.0,
-    dt_max: float = 0.01,
+    dt_max: float = 0.05,
     t_max: float = 15.0,
+    simplify_yards: float = 0.0,
+    return_points: bool = True,
 ) -> TrajectoryResult:
     """Simulate full 3D ball flight trajectory.
 
@@ -188,12 +301,34 @@ def compute_trajectory(
         launch: Ball launch conditions.
         wind_speed_mph: Wind speed in mph.
         wind_direction_deg: Wind coming FROM this direction (0=N, 90=E).
-        dt_max: Maximum time step for ODE solver.
+        dt_max: Fixed RK4 time step in seconds. Points are sampled at
+            this interval (the visualizer animates them as uniform time
+            steps); 0.05 s keeps carry/apex within ~0.2 yd of a 0.5 ms
+            reference step.
         t_max: Maximum simulation time in seconds.
+        simplify_yards: If > 0, thin the points with Ramer-Douglas-Peucker
+            at this tolerance (apex and landing are always kept). Thinned
+            points are no longer uniform in time, so leave at 0 for
+            anything the visualizer animates.
+        return_points: If False, only the landing point is converted and
+            returned in `points`, for callers that only need the summary
+            stats (which are identical either way).
 
     Returns:
         TrajectoryResult with trajectory points and summary stats.
     """
+    # Miss-hits and sensor glitches: nothing worth integrating
+    if (launch.ball_speed_mph < MIN_SWING_SPEED_MPH
+            or launch.vla_deg < MIN_LAUNCH_ANGLE_DEG):
+        return TrajectoryResult(
+            points=np.zeros((1, 3), dtype=np.float32),
+            carry_yards=0.0,
+            total_yards=0.0,
+            apex_yards=0.0,
+            lateral_yards=0.0,
+            flight_time_s=0.0,
+        )
+
     # Convert launch conditions to SI units (m, m/s, rad/s)
     v0 = launch.ball_speed_mph * MPH_TO_MS
     vla_rad = math.radians(launch.vla_deg)
@@ -204,15 +339,10 @@ def compute_trajectory(
     vy0 = v0 * math.sin(vla_rad)                        # vertical
     vz0 = v0 * math.cos(vla_rad) * math.cos(hla_rad)   # downrange
 
-    # Spin: decompose into components using spin axis
-    total_spin_rps = launch.backspin_rpm / 60.0  # rev/s
+    # Spin: total rate in rev/s, split by the spin axis inside _rhs
+    total_spin_rps = launch.backspin_rpm / 60.0
     spin_axis_rad = math.radians(launch.spin_axis_deg)
 
-    # Backspin is around the horizontal axis perpendicular to flight
-    # Sidespin from spin axis tilt
-    omega_backspin = total_spin_rps * math.cos(spin_axis_rad) * 2 * math.pi
-    omega_sidespin = total_spin_rps * math.sin(spin_axis_rad) * 2 * math.pi
-
     # Wind in m/s (wind_direction is where it comes FROM)
     wind_v = wind_speed_mph * MPH_TO_MS
     wind_rad = math.radians(wind_direction_deg)
@@ -220,128 +350,27 @@ def compute_trajectory(
     wind_z = -wind_v * math.cos(wind_rad)  # downrange
 
     # State vector: [x, y, z, vx, vy, vz]
-    y0 = [0.0, 0.0, 0.0, vx0, vy0, vz0]
-
-    # Spin decay rate (exponential, ~1% per second)
-    spin_decay_rate = 0.01
-
-    def derivatives(t, state):
-        """ODE right-hand side: equations of motion for a spinning golf ball."""
-        x, y, z, vx, vy, vz = state
-
-        # Velocity relative to air (accounting for wind)
-        vrel_x = vx - wind_x
-        vrel_y = vy
-        vrel_z = vz - wind_z
-        v_rel = math.sqrt(vrel_x**2 + vrel_y**2 + vrel_z**2)
-
-        if v_rel < 0.1:
-            return [vx, vy, vz, 0, -GRAVITY, 0]
-
-        # Unit velocity vector
-        ux = vrel_x / v_rel
-        uy = vrel_y / v_rel
-        uz = vrel_z / v_rel
-
-        # Current spin rate with decay
-        current_spin_rps = total_spin_rps * math.exp(-spin_decay_rate * t)
-
-        # --- Drag force ---
-        # Spin ratio = surface speed / translational speed
-        spin_ratio = (current_spin_rps * 2 * math.pi * BALL_RADIUS) / v_rel
-        cd = _drag_coefficient(spin_ratio, v_rel)
-        F_drag = 0.5 * cd * AIR_DENSITY * BALL_AREA * v_rel**2
-
-        drag_x = -F_drag * ux / BALL_MASS
-        drag_y = -F_drag * uy / BALL_MASS
-        drag_z = -F_drag * uz / BALL_MASS
-
-        # --- Magnus lift force ---
-        # The Magnus force acts perpendicular to both velocity and spin axis.
-        # For backspin: creates upward lift.
-        # For tilted spin axis: creates lateral force (curve).
-        #
-        # Spin vector in body frame (backspin = rotation around lateral axis):
-        #   omega = (omega_side, 0, omega_back) approximately
-        # We use the cross product omega × v to get lift direction.
-
-        cl = _lift_coefficient(spin_ratio)
-        F_lift = 0.5 * cl * AIR_DENSITY * BALL_AREA * v_rel**2
-
-        # Decompose lift based on spin axis angle:
-        # spin_axis = 0° → pure backspin → all lift is upward
-        # spin_axis = ±45° → mix of backspin and sidespin
-        backspin_fraction = math.cos(spin_axis_rad)
-        sidespin_fraction = math.sin(spin_axis_rad)
-
-        # Backspin component: lift perpendicular to velocity in the
-        # vertical plane (upward when ball is moving forward)
-        # We need the lift to be perpendicular to velocity, not just "up"
-        v_horiz = math.sqrt(vrel_x**2 + vrel_z**2)
-        if v_horiz > 0.1:
-            # Upward component of backspin lift
-            lift_y = F_lift * backspin_fraction * v_horiz / v_rel / BALL_MASS
-            # The backspin lift also has a small backward component
-            # (it's perpendicular to velocity, not purely vertical)
-        else:
-            lift_y = F_lift * backspin_fraction / BALL_MASS
-
-        # Sidespin component: lateral force
-        lift_x = F_lift * sidespin_fraction / BALL_MASS
-
-        # Total accelerations
-        ax = drag_x + lift_x
-        ay = drag_y + lift_y - GRAVITY
-        az = drag_z
-
-        return [vx, vy, vz, ax, ay, az]
-
-    def hit_ground(t, state):
-        """Event: ball returns to ground level (y = 0)."""
-        return state[1]
-
-    hit_ground.terminal = True
-    hit_ground.direction = -1  # Only trigger when y is decreasing
-
-    # Integrate
-    sol = solve_ivp(
-        derivatives,
-        [0, t_max],
-        y0,
-        method="RK45",
-        max_step=dt_max,
-        events=[hit_ground],
-        dense_output=True,
+    y0 = np.array([0.0, 0.0, 0.0, vx0, vy0, vz0])
+
+    # Integrate (compiled RK4 loop, stops at ground impact)
+    times, states = _integrate(
+        y0, wind_x, wind_z, total_spin_rps, spin_axis_rad,
+        SPIN_DECAY_RATE, t_max, dt_max,
     )
 
-    if not sol.success:
-        logger.warning(f"ODE integration failed: {sol.message}")
-        return TrajectoryResult(
-            points=[(0, 0, 0)],
-            carry_yards=0,
-            total_yards=0,
-            apex_yards=0,
-            lateral_yards=0,
-            flight_time_s=0,
-        )
+    # Apex from the raw altitudes (the unit scale is monotonic, so this is
+    # the max over the converted points)
+    apex = float(states[:, 1].max() * METERS_TO_YARDS)
 
-    # Extract trajectory points in yards
-    points = []
-    apex = 0.0
-    for i in range(len(sol.t)):
-        x_yd = sol.y[0][i] * METERS_TO_YARDS
-        y_yd = sol.y[1][i] * METERS_TO_YARDS
-        z_yd = sol.y[2][i] * METERS_TO_YARDS
-        points.append((round(x_yd, 1), round(max(0, y_yd), 1), round(z_yd, 1)))
-        apex = max(apex, y_yd)
-
-    # Landing point
-    if points:
-        landing_x = points[-1][0]
-        landing_z = points[-1][2]
-    else:
-        landing_x = 0
-        landing_z = 0
+    # Extract trajectory points in yards (one vectorized pass)
+    xyz = (states if return_points else states[-1:])[:, :3] * METERS_TO_YARDS
+    xyz[:, 1] = np.maximum(xyz[:, 1], 0.0)
+    xyz = np.round(xyz, 1)
+    if return_points and simplify_yards > 0 and len(xyz) > 2:
+        xyz = xyz[_rdp_keep(xyz, simplify_yards)]
+
+    # Landing point (summary stats from the float64 values)
+    landing_x, _, landing_z = xyz[-1].tolist()
 
     carry = math.sqrt(landing_x**2 + landing_z**2)
 
@@ -350,10 +379,10 @@ def compute_trajectory(
     roll_factor = max(0.02, 0.15 - launch.vla_deg / 200 - launch.backspin_rpm / 100000)
     total = carry + carry * roll_factor
 
-    flight_time = sol.t[-1] if len(sol.t) > 0 else 0
+    flight_time = float(times[-1])
 
     return TrajectoryResult(
-        points=points,
+        points=xyz.astype(np.float32),
         carry_yards=round(carry, 1),
         total_yards=round(total, 1),
         apex_yards=round(apex, 1),
@@ -362,6 +391,268 @@ def compute_trajectory(
     )
 
 
+def compute_putt(launch: BallLaunch, dt: float = 0.05) -> TrajectoryResult:
+    """Closed-form rolling trajectory for a putt.
+
+    A putt never leaves the green, so there is no air phase to integrate:
+    the ball rolls along the horizontal launch direction with constant
+    deceleration (GREEN_ROLL_DECEL) until it stops.
+
+    Args:
+        launch: Ball launch conditions (only speed and HLA are used).
+        dt: Time between trajectory points in seconds.
+
+    Returns:
+        TrajectoryResult with zero carry/apex and the roll as total distance.
+    """
+    v0 = launch.ball_speed_mph * MPH_TO_MS
+    times, states = _roll(v0, math.radians(launch.hla_deg),
+                          GREEN_ROLL_DECEL, dt)
+
+    xyz = np.round(states[:, :3] * METERS_TO_YARDS, 1)
+    end_x, _, end_z = xyz[-1].tolist()
+
+    return TrajectoryResult(
+        points=xyz.astype(np.float32),
+        carry_yards=0.0,
+        total_yards=round(math.sqrt(end_x**2 + end_z**2), 1),
+        apex_yards=0.0,
+        lateral_yards=round(end_x, 1),
+        flight_time_s=round(float(times[-1]), 2),
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _roll(v0, hla_rad, decel, dt):
+    """Sample a constant-deceleration roll until the ball stops.
+
+    Returns:
+        Tuple of (times, states) shaped like _integrate's output, with the
+        last row at the exact stopping time.
+    """
+    t_stop = v0 / decel
+    n = int(t_stop / dt) + 2
+    times = np.empty(n, dtype=np.float64)
+    states = np.zeros((n, 6), dtype=np.float64)
+    sin_h = math.sin(hla_rad)
+    cos_h = math.cos(hla_rad)
+
+    for i in range(n):
+        t = min(i * dt, t_stop)
+        dist = v0 * t - 0.5 * decel * t * t
+        speed = v0 - decel * t
+        times[i] = t
+        states[i, 0] = dist * sin_h
+        states[i, 2] = dist * cos_h
+        states[i, 3] = speed * sin_h
+        states[i, 5] = speed * cos_h
+
+    # Drop the duplicated stop sample when t_stop falls exactly on a step
+    if n > 1 and times[n - 2] == t_stop:
+        n -= 1
+    return times[:n], states[:n]
+
+
+@njit(cache=True, fastmath=True)
+def _rhs(t, x, y, z, vx, vy, vz, wind_x, wind_z, total_spin_rps,
+         cos_axis, sin_axis, spin_decay):
+    """ODE right-hand side: equations of motion for a spinning golf ball.
+
+    The spin axis is passed as its precomputed cosine/sine since it is
+    constant over the flight.
+
+    Returns:
+        Tuple of state derivatives (vx, vy, vz, ax, ay, az).
+    """
+    # Velocity relative to air (accounting for wind)
+    vrel_x = vx - wind_x
+    vrel_y = vy
+    vrel_z = vz - wind_z
+    v_rel = math.sqrt(vrel_x * vrel_x + vrel_y * vrel_y + vrel_z * vrel_z)
+
+    if v_rel < 0.1:
+        return vx, vy, vz, 0.0, -GRAVITY, 0.0
+
+    # Current spin rate with decay
+    current_spin_rps = total_spin_rps * math.exp(-spin_decay * t)
+
+    # --- Drag force ---
+    # Spin ratio = surface speed / translational speed
+    spin_ratio = (current_spin_rps * _TWO_PI_R) / v_rel
+    cd = _drag_coefficient(spin_ratio, v_rel)
+    q = _HALF_RHO_A * v_rel * v_rel
+
+    # Drag opposes the relative velocity: -(cd * q / m) * vrel / |vrel|,
+    # folded into one factor on the velocity components (no unit vector)
+    k_drag = -cd * _HALF_RHO_A * _INV_MASS * v_rel
+    drag_x = k_drag * vrel_x
+    drag_y = k_drag * vrel_y
+    drag_z = k_drag * vrel_z
+
+    # --- Magnus lift force ---
+    # The Magnus force acts perpendicular to both velocity and spin axis.
+    # For backspin: creates upward lift.
+    # For tilted spin axis: creates lateral force (curve).
+    #
+    # Spin vector in body frame (backspin = rotation around lateral axis):
+    #   omega = (omega_side, 0, omega_back) approximately
+    # We use the cross product omega × v to get lift direction.
+
+    cl = _lift_coefficient(spin_ratio)
+    lift_accel = cl * q * _INV_MASS
+
+    # Decompose lift based on spin axis angle:
+    # spin_axis = 0° → pure backspin → all lift is upward
+    # spin_axis = ±45° → mix of backspin and sidespin
+    # (cos_axis = backspin fraction, sin_axis = sidespin fraction)
+
+    # Backspin component: lift perpendicular to velocity in the
+    # vertical plane (upward when ball is moving forward)
+    # We need the lift to be perpendicular to velocity, not just "up"
+    v_horiz = math.sqrt(vrel_x * vrel_x + vrel_z * vrel_z)
+    if v_horiz > 0.1:
+        # Upward component of backspin lift
+        lift_y = lift_accel * cos_axis * v_horiz / v_rel
+        # The backspin lift also has a small backward component
+        # (it's perpendicular to velocity, not purely vertical)
+    else:
+        lift_y = lift_accel * cos_axis
+
+    # Sidespin component: lateral force
+    lift_x = lift_accel * sin_axis
+
+    # Total accelerations
+    ax = drag_x + lift_x
+    ay = drag_y + lift_y - GRAVITY
+    az = drag_z
+
+    return vx, vy, vz, ax, ay, az
+
+
+@njit(cache=True, fastmath=True)
+def _integrate(y0, wind_x, wind_z, total_spin_rps, spin_axis_rad,
+               spin_decay, t_max, dt):
+    """Classic fixed-step RK4 integration from launch to ground impact.
+
+    The step that carries the ball below y = 0 is replaced by a linear
+    interpolation to the exact ground crossing, so the last row is the
+    landing point.
+
+    Args:
+        y0: Initial state [x, y, z, vx, vy, vz] in SI units.
+        wind_x: Lateral wind velocity (m/s).
+        wind_z: Downrange wind velocity (m/s).
+        total_spin_rps: Total spin rate at launch (rev/s).
+        spin_axis_rad: Spin axis tilt (radians).
+        spin_decay: Exponential spin decay rate (1/s).
+        t_max: Maximum simulation time (s).
+        dt: Integration time step (s).
+
+    Returns:
+        Tuple of (times, states): shape (n,) and (n, 6) arrays.
+    """
+    n_max = int(t_max / dt) + 2
+    times = np.empty(n_max, dtype=np.float64)
+    states = np.empty((n_max, 6), dtype=np.float64)
+
+    x, y, z = y0[0], y0[1], y0[2]
+    vx, vy, vz = y0[3], y0[4], y0[5]
+    t = 0.0
+    times[0] = t
+    states[0, 0] = x
+    states[0, 1] = y
+    states[0, 2] = z
+    states[0, 3] = vx
+    states[0, 4] = vy
+    states[0, 5] = vz
+    n = 1
+
+    cos_axis = math.cos(spin_axis_rad)
+    sin_axis = math.sin(spin_axis_rad)
+    half = 0.5 * dt
+    while n < n_max:
+        k1 = _rhs(t, x, y, z, vx, vy, vz,
+                  wind_x, wind_z, total_spin_rps,
+                  cos_axis, sin_axis, spin_decay)
+        k2 = _rhs(t + half,
+                  x + half * k1[0], y + half * k1[1], z + half * k1[2],
+                  vx + half * k1[3], vy + half * k1[4], vz + half * k1[5],
+                  wind_x, wind_z, total_spin_rps,
+                  cos_axis, sin_axis, spin_decay)
+        k3 = _rhs(t + half,
+                  x + half * k2[0], y + half * k2[1], z + half * k2[2],
+                  vx + half * k2[3], vy + half * k2[4], vz + half * k2[5],
+                  wind_x, wind_z, total_spin_rps,
+                  cos_axis, sin_axis, spin_decay)
+        k4 = _rhs(t + dt,
+                  x + dt * k3[0], y + dt * k3[1], z + dt * k3[2],
+                  vx + dt * k3[3], vy + dt * k3[4], vz + dt * k3[5],
+                  wind_x, wind_z, total_spin_rps,
+                  cos_axis, sin_axis, spin_decay)
+
+        w = dt / 6.0
+        nx = x + w * (k1[0] + 2.0 * k2[0] + 2.0 * k3[0] + k4[0])
+        ny = y + w * (k1[1] + 2.0 * k2[1] + 2.0 * k3[1] + k4[1])
+        nz = z + w * (k1[2] + 2.0 * k2[2] + 2.0 * k3[2] + k4[2])
+        nvx = vx + w * (k1[3] + 2.0 * k2[3] + 2.0 * k3[3] + k4[3])
+        nvy = vy + w * (k1[4] + 2.0 * k2[4] + 2.0 * k3[4] + k4[4])
+        nvz = vz + w * (k1[5] + 2.0 * k2[5] + 2.0 * k3[5] + k4[5])
+
+        if ny < 0.0:
+            # Ground impact: find the y = 0 crossing on the cubic Hermite
+            # through both endpoints (positions + velocities). Newton starts
+            # from the end of the step so a first-step landing (y == 0 at
+            # the start) doesn't collapse onto the launch root.
+            frac = 1.0
+            for _ in range(4):
+                df = _hermite_slope(y, vy, ny, nvy, frac, dt)
+                if df == 0.0:
+                    break
+                frac -= _hermite(y, vy, ny, nvy, frac, dt) / df
+            if not 0.0 < frac <= 1.0:
+                frac = y / (y - ny)  # fall back to the chord
+            times[n] = t + frac * dt
+            states[n, 0] = _hermite(x, vx, nx, nvx, frac, dt)
+            states[n, 1] = 0.0
+            states[n, 2] = _hermite(z, vz, nz, nvz, frac, dt)
+            states[n, 3] = vx + frac * (nvx - vx)
+            states[n, 4] = vy + frac * (nvy - vy)
+            states[n, 5] = vz + frac * (nvz - vz)
+            n += 1
+            break
+
+        x, y, z, vx, vy, vz = nx, ny, nz, nvx, nvy, nvz
+        t += dt
+        times[n] = t
+        states[n, 0] = x
+        states[n, 1] = y
+        states[n, 2] = z
+        states[n, 3] = vx
+        states[n, 4] = vy
+        states[n, 5] = vz
+        n += 1
+
+    return times[:n], states[:n]
+
+
+@njit(cache=True, fastmath=True)
+def _hermite(p0, v0, p1, v1, s, dt):
+    """Cubic Hermite position at fraction s of a step of length dt."""
+    s2 = s * s
+    s3 = s2 * s
+    return ((2 * s3 - 3 * s2 + 1) * p0 + (s3 - 2 * s2 + s) * dt * v0
+            + (3 * s2 - 2 * s3) * p1 + (s3 - s2) * dt * v1)
+
+
+@njit(cache=True, fastmath=True)
+def _hermite_slope(p0, v0, p1, v1, s, dt):
+    """Derivative of _hermite with respect to s."""
+    s2 = s * s
+    return ((6 * s2 - 6 * s) * p0 + (3 * s2 - 4 * s + 1) * dt * v0
+            + (6 * s - 6 * s2) * p1 + (3 * s2 - 2 * s) * dt * v1)
+
+
+@njit(cache=True, fastmath=True, inline='always')
 def _drag_coefficient(spin_ratio: float, velocity: float) -> float:
     """Compute drag coefficient based on spin ratio and velocity.
 
@@ -390,6 +681,7 @@ def _drag_coefficient(spin_ratio: float, velocity: float) -> float:
     return min(cd, 0.55)
 
 
+@njit(cache=True, fastmath=True, inline='always')
 def _lift_coefficient(spin_ratio: float) -> float:
     """Compute lift coefficient (Magnus effect) for a dimpled golf ball.
 
@@ -417,6 +709,54 @@ def _lift_coefficient(spin_ratio: float) -> float:
     return min(cl, 0.32)
 
 
+def _rdp_keep(xyz: np.ndarray, epsilon: float) -> np.ndarray:
+    """Ramer-Douglas-Peucker point selection for a 3D polyline.
+
+    The apex is seeded as a split point so it survives alongside the
+    first and last points.
+
+    Args:
+        xyz: (N, 3) array of points.
+        epsilon: Maximum perpendicular deviation to discard (same units).
+
+    Returns:
+        Sorted indices of the points to keep.
+    """
+    n = len(xyz)
+    keep = np.zeros(n, dtype=bool)
+    apex_idx = int(np.argmax(xyz[:, 1]))
+    keep[[0, apex_idx, n - 1]] = True
+
+    stack = [(0, apex_idx), (apex_idx, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        seg = xyz[end] - xyz[start]
+        rel = xyz[start + 1:end] - xyz[start]
+        seg_len = np.linalg.norm(seg)
+        if seg_len == 0.0:
+            dist = np.linalg.norm(rel, axis=1)
+        else:
+            dist = np.linalg.norm(np.cross(rel, seg), axis=1) / seg_len
+        i = int(np.argmax(dist))
+        if dist[i] > epsilon:
+            mid = start + 1 + i
+            keep[mid] = True
+            stack.append((start, mid))
+            stack.append((mid, end))
+
+    return np.flatnonzero(keep)
+
+
+# Warm the JIT once at import so the first real shot doesn't pay the
+# compile cost (a near-instant no-op when Numba is unavailable).
+_integrate(np.zeros(6), 0.0, 0.0, 0.0, 0.0, SPIN_DECAY_RATE, 1.0, 0.01)
+_roll(0.0, 0.0, GREEN_ROLL_DECEL, 0.05)
+_drag_coefficient(0.1, 50.0)
+_lift_coefficient(0.1)
+
+
 # =============================================================================
 # Convenience: Full pipeline from club data to trajectory
 # =============================================================================
@@ -438,11 +778,15 @@ def compute_shot(club_data: ClubData,
         Tuple of (BallLaunch, TrajectoryResult).
     """
     launch = club_to_ball_launch(club_data)
-    trajectory = compute_trajectory(
-        launch,
-        wind_speed_mph=wind_speed_mph,
-        wind_direction_deg=wind_direction_deg,
-    )
+    if club_data.club_type == "Putter":
+        # Putts stay on the ground: closed-form roll, no air phase
+        trajectory = compute_putt(launch)
+    else:
+        trajectory = compute_trajectory(
+            launch,
+            wind_speed_mph=wind_speed_mph,
+            wind_direction_deg=wind_direction_deg,
+        )
 
     logger.info(
         f"Shot computed: {club_data.club_type} "
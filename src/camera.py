@@ -7,12 +7,24 @@ impact moment (pre + post seconds) and saves it as an MP4 file.
 
 Threading: Runs on a dedicated QThread. The circular buffer
 is accessed only from this thread. Clip extraction is triggered
-via a Qt signal from the USB reader thread.
+via a Qt signal from the USB reader thread. Finished clips are
+handed to a ClipWriter thread for encoding, so capture never
+stalls on the video encoder.
+
+Memory: Frames are decoded straight into a preallocated ring of
+(N, H, W, 3) uint8 slots with a parallel timestamp array and a
+published write counter, so the capture loop does no per-frame
+allocation, copying or locking.
 """
 
+import functools
 import logging
+import platform
+import queue
+import re
+import shutil
+import subprocess
 import time
-from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -20,23 +32,51 @@ from typing import Optional
 import cv2
 import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal, QMutex, QMutexLocker
+from PyQt6.QtGui import QImage
 
 from src.utils.config import Config
+from src.utils.video import bgr_to_qimage, open_capture
+
+try:
+    import av
+except ImportError:  # optional: hardware H.264 encoding via FFmpeg
+    av = None
 
 logger = logging.getLogger(__name__)
 
+# Hardware H.264 encoders tried (via PyAV) before falling back to
+# OpenCV's software mp4v writer: NVIDIA NVENC, then macOS VideoToolbox.
+HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox")
+
+# Jetson (aarch64) clip encoding through OpenCV's GStreamer backend and
+# the NVENC block; BGR is converted to NV12 by the VIC, not the CPU.
+JETSON_PIPELINE = (
+    "appsrc ! video/x-raw,format=BGR,width={width},height={height},"
+    "framerate={fps}/1 ! queue ! videoconvert ! video/x-raw,format=BGRx ! "
+    "nvvidconv ! nvv4l2h264enc bitrate=8000000 ! h264parse ! qtmux ! "
+    "filesink location={path}"
+)
+
+# Live preview is emitted at 1/N resolution; the video panel is far
+# smaller than the capture size and scales the image again anyway.
+PREVIEW_DOWNSCALE = 2
+
+# How often an idle clip writer checks for stop() when its queue was full
+CLIP_WRITER_POLL_S = 0.2
+
 
 class CameraCapture(QThread):
     """Webcam capture with circular buffer and swing-triggered clip saving.
 
     Signals:
-        frame_ready(ndarray): Emitted for each captured frame (for live preview).
+        frame_ready(QImage): Emitted with a downscaled BGR copy of every
+            other captured frame (for live preview).
         clip_saved(str): Emitted when a clip is saved, with the file path.
         camera_opened(): Emitted when the camera is successfully opened.
         camera_error(str): Emitted on camera errors.
     """
 
-    frame_ready = pyqtSignal(object)     # np.ndarray
+    frame_ready = pyqtSignal(QImage)
     clip_saved = pyqtSignal(str)         # file path
     camera_opened = pyqtSignal()
     camera_error = pyqtSignal(str)
@@ -48,6 +88,8 @@ class CameraCapture(QThread):
         resolution: tuple[int, int] = (1280, 720),
         pre_seconds: float = 2.0,
         post_seconds: float = 2.0,
+        ring_scale: Optional[int] = None,
+        ring_fps_divisor: Optional[int] = None,
         parent=None,
     ):
         """
@@ -57,25 +99,52 @@ class CameraCapture(QThread):
             resolution: (width, height) of captured frames.
             pre_seconds: Seconds of video to keep before impact.
             post_seconds: Seconds of video to record after impact.
+            ring_scale: Store buffered and clip frames at 1/N of the
+                capture size (default: config "camera_ring_scale"). The
+                impact frame is additionally kept at full resolution.
+            ring_fps_divisor: Keep every Nth frame, so clips run at
+                fps / N (default: config "camera_ring_fps_divisor").
         """
         super().__init__(parent)
+        config = Config()
+        if ring_scale is None:
+            ring_scale = config.get("camera_ring_scale", 1)
+        if ring_fps_divisor is None:
+            ring_fps_divisor = config.get("camera_ring_fps_divisor", 1)
+
         self._camera_index = camera_index
-        self._fps = fps
+        self._camera_fps = fps
+        self._fps = max(1, fps // max(1, ring_fps_divisor))  # stored/clip fps
+        self._ring_scale = max(1, int(ring_scale))
         self._resolution = resolution
         self._pre_seconds = pre_seconds
         self._post_seconds = post_seconds
         self._running = False
 
-        # Circular buffer: stores (frame, timestamp) tuples
-        buffer_size = int((pre_seconds + 1) * fps)  # Extra second of margin
-        self._buffer: deque[tuple[np.ndarray, float]] = deque(maxlen=buffer_size)
-        self._buffer_mutex = QMutex()
+        # Frame ring: sized to hold the pre-impact window plus the
+        # post-impact frames of a clip in progress (+1s margin).
+        # Allocated on the first frame, once the real frame size is known.
+        # Slots queued for the clip writer are refcounted in _slot_locks;
+        # capture drops a frame rather than overwrite a locked slot.
+        self._ring_size = int((pre_seconds + post_seconds + 1) * self._fps)
+        self._frames: Optional[np.ndarray] = None
+        self._staging: Optional[np.ndarray] = None  # full-res decode target
+        self._impact_frame: Optional[np.ndarray] = None
+        self._slot_locks: Optional[np.ndarray] = None
+        self._lock_mutex = QMutex()
+
+        # Single-producer ring index: frames are written to consecutive
+        # slots and _write_count (total frames written) is bumped only
+        # after the slot is complete, so readers on other threads need no
+        # lock. Live frames are the last min(_write_count, _ring_size)
+        # counts; slot = count % _ring_size.
+        self._write_count = 0
 
         # Clip extraction state
         self._extract_requested = False
-        self._extract_time: float = 0.0
+        self._extract_count: int = 0  # ring count of first post frame
         self._post_frames_remaining: int = 0
-        self._clip_frames: list[tuple[np.ndarray, float]] = []
+        self._clip_frames: list[int] = []  # ring slots of post frames
         self._clip_session_dir: Optional[Path] = None
 
         # Session clip directory
@@ -84,6 +153,10 @@ class CameraCapture(QThread):
         # Clip counter
         self._clip_count = 0
 
+        # Background encoder for finished clips
+        self._writer = ClipWriter(parent=self)
+        self._writer.clip_saved.connect(self.clip_saved)
+
     def _setup_session_dir(self):
         """Create a session-specific directory for clips."""
         clips_dir = Config.get_clips_dir()
@@ -98,7 +171,6 @@ class CameraCapture(QThread):
         Called from the USB reader thread via signal connection.
         Sets a flag that the capture loop will process.
         """
-        self._extract_time = time.time()
         self._extract_requested = True
         self._post_frames_remaining = int(self._post_seconds * self._fps)
         logger.info("Clip extraction requested")
@@ -113,7 +185,7 @@ class CameraCapture(QThread):
             f"res={self._resolution})"
         )
 
-        cap = cv2.VideoCapture(self._camera_index)
+        cap = open_capture(self._camera_index)
         if not cap.isOpened():
             msg = f"Cannot open camera {self._camera_index}"
             logger.error(msg)
@@ -123,7 +195,7 @@ class CameraCapture(QThread):
         # Configure camera
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, self._resolution[0])
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self._resolution[1])
-        cap.set(cv2.CAP_PROP_FPS, self._fps)
+        cap.set(cv2.CAP_PROP_FPS, self._camera_fps)
 
         actual_fps = cap.get(cv2.CAP_PROP_FPS)
         actual_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -132,68 +204,149 @@ class CameraCapture(QThread):
             f"Camera opened: {actual_w}x{actual_h} @ {actual_fps}fps"
         )
         self.camera_opened.emit()
+        self._writer.start()
 
-        frame_interval = 1.0 / self._fps
-        last_frame_time = 0.0
+        # Accept frames no closer than 80% of the target interval
+        min_interval_ns = int(0.8e9 / self._fps)
+        last_frame_ns = -min_interval_ns
 
         while self._running:
-            ret, frame = cap.read()
-            if not ret:
+            if not cap.grab():
                 time.sleep(0.001)
                 continue
 
-            now = time.time()
+            now_ns = time.monotonic_ns()
 
-            # Rate limiting (if camera is faster than target fps)
-            if now - last_frame_time < frame_interval * 0.8:
+            # Rate limiting (if camera is faster than target fps);
+            # skipped frames are grabbed but never decoded
+            if now_ns - last_frame_ns < min_interval_ns:
                 continue
-            last_frame_time = now
+            last_frame_ns = now_ns
 
-            # Add frame to circular buffer
-            with QMutexLocker(self._buffer_mutex):
-                self._buffer.append((frame.copy(), now))
-
-            # Emit frame for live preview (every other frame to reduce load)
-            if len(self._buffer) % 2 == 0:
-                self.frame_ready.emit(frame)
+            # Decode directly into the next ring slot, unless the clip
+            # writer has fallen a full margin behind and still holds it
+            slot = self._write_count % self._ring_size
+            if self._slot_locks is not None and self._slot_locks[slot]:
+                logger.debug(f"Ring slot {slot} busy; dropping frame")
+                continue
+            frame = self._retrieve_into_slot(cap, slot)
+            if frame is None:
+                continue
+            slot = self._write_count % self._ring_size  # 0 after realloc
+            self._write_count += 1  # publish
+
+            # Emit a downscaled QImage copy for live preview (every other
+            # frame to reduce load); never hand the GUI a view into the ring.
+            # A ring already at or below preview size is copied, not resized
+            if self._write_count % 2 == 0:
+                h, w = frame.shape[:2]
+                scale = self._ring_scale
+                divisor = max(scale, PREVIEW_DOWNSCALE)
+                size = (w * scale // divisor, h * scale // divisor)
+                self.frame_ready.emit(bgr_to_qimage(frame, size))
 
             # Handle clip extraction
             if self._extract_requested:
+                if not self._clip_frames:
+                    # First frame after impact: everything before it in
+                    # the ring is pre-impact. Keep it at full resolution.
+                    self._extract_count = self._write_count - 1
+                    full = self._staging if self._ring_scale > 1 else frame
+                    self._impact_frame = full.copy()
                 if self._post_frames_remaining > 0:
-                    self._clip_frames.append((frame.copy(), now))
+                    self._clip_frames.append(slot)
                     self._post_frames_remaining -= 1
                 else:
-                    # Post-impact recording complete — save the clip
+                    # Post-impact recording complete — queue the clip
                     self._save_clip()
                     self._extract_requested = False
 
         cap.release()
+        self._writer.stop()
+        self._writer.wait()
         logger.info("Camera capture stopped")
 
+    def _retrieve_into_slot(self, cap: cv2.VideoCapture,
+                            slot: int) -> Optional[np.ndarray]:
+        """Decode the grabbed frame into ring slot `slot`.
+
+        Allocates the ring on the first frame (and reallocates if the
+        camera changes resolution mid-stream, restarting at slot 0).
+        With ring_scale > 1 the frame is decoded into a reused full-res
+        staging buffer and area-downscaled into the slot.
+
+        Returns:
+            The slot view holding the frame, or None if decoding failed.
+        """
+        if self._ring_scale > 1:
+            ret, full = cap.retrieve(self._staging)
+            if not ret:
+                return None
+            self._staging = full
+            h, w, ch = full.shape
+            shape = (h // self._ring_scale, w // self._ring_scale, ch)
+            if self._frames is None or self._frames.shape[1:] != shape:
+                self._allocate_ring(shape)
+                slot = 0
+            dst = self._frames[slot]
+            cv2.resize(full, (shape[1], shape[0]), dst=dst,
+                       interpolation=cv2.INTER_AREA)
+            return dst
+
+        if self._frames is None:
+            ret, frame = cap.retrieve()
+            if not ret:
+                return None
+            self._allocate_ring(frame.shape)
+            self._frames[0] = frame
+            return self._frames[0]
+
+        dst = self._frames[slot]
+        ret, frame = cap.retrieve(dst)
+        if not ret:
+            return None
+        if frame is not dst:
+            if frame.shape != dst.shape:
+                self._allocate_ring(frame.shape)
+                dst = self._frames[0]
+            np.copyto(dst, frame)
+        return dst
+
+    def _allocate_ring(self, frame_shape: tuple[int, ...]):
+        """(Re)allocate the frame ring, dropping any buffered frames."""
+        self._write_count = 0
+        self._frames = np.empty(
+            (self._ring_size, *frame_shape), dtype=np.uint8
+        )
+        # Pending writer jobs keep (and release into) the old arrays
+        self._slot_locks = np.zeros(self._ring_size, dtype=np.int32)
+        self._clip_frames = []
+        logger.debug(
+            f"Frame ring allocated: {self._ring_size} x {frame_shape} "
+            f"({self._frames.nbytes / 1e6:.0f} MB)"
+        )
+
     def _save_clip(self):
-        """Save the extracted clip as an MP4 file.
+        """Queue the extracted clip for writing as an MP4 file.
 
         Combines pre-impact frames from the circular buffer with
-        post-impact frames recorded after the extraction request.
+        post-impact frames recorded after the extraction request, locks
+        their ring slots and hands them to the clip writer thread.
         """
-        # Get pre-impact frames from the buffer
+        # Pre-impact frames are the N ring entries written just before
+        # the first post-impact frame (oldest first). This runs on the
+        # capture thread, so the ring cannot advance meanwhile.
         pre_frame_count = int(self._pre_seconds * self._fps)
-        with QMutexLocker(self._buffer_mutex):
-            buffer_frames = list(self._buffer)
-
-        # Find frames before the extraction time
-        pre_frames = [
-            (f, t) for f, t in buffer_frames
-            if t <= self._extract_time
-        ]
-        # Take only the last N frames
-        pre_frames = pre_frames[-pre_frame_count:]
+        count = self._write_count
+        end = min(self._extract_count, count)
+        start = max(0, count - self._ring_size, end - pre_frame_count)
+        pre_frames = [i % self._ring_size for i in range(start, end)]
 
         # Combine pre + post frames
-        all_frames = pre_frames + self._clip_frames
+        slots = pre_frames + self._clip_frames
         self._clip_frames = []
 
-        if not all_frames:
+        if not slots:
             logger.warning("No frames available for clip extraction")
             return
 
@@ -202,36 +355,223 @@ class CameraCapture(QThread):
         filename = f"shot_{self._clip_count:03d}.mp4"
         filepath = self._clip_session_dir / filename
 
-        # Write MP4
-        height, width = all_frames[0][0].shape[:2]
-        fourcc = cv2.VideoWriter.fourcc(*"mp4v")
-        writer = cv2.VideoWriter(
-            str(filepath), fourcc, self._fps, (width, height)
-        )
+        locks = self._slot_locks
+        with QMutexLocker(self._lock_mutex):
+            locks[slots] += 1
 
-        if not writer.isOpened():
-            logger.error(f"Cannot create video writer for {filepath}")
-            return
+        def release(slot: int):
+            with QMutexLocker(self._lock_mutex):
+                locks[slot] -= 1
+
+        if not self._writer.submit(self._frames, slots, filepath,
+                                   self._fps, release):
+            logger.warning(f"Clip writer busy; dropping {filepath.name}")
+            with QMutexLocker(self._lock_mutex):
+                locks[slots] -= 1
+
+    def stop(self):
+        """Signal the thread to stop."""
+        self._running = False
 
-        for frame, _ in all_frames:
-            writer.write(frame)
+    def get_impact_frame(self) -> Optional[np.ndarray]:
+        """Full-resolution frame captured at the most recent impact."""
+        return self._impact_frame
 
-        writer.release()
+    def get_latest_frame(self) -> Optional[np.ndarray]:
+        """Get the most recent frame from the ring (thread-safe, lock-free)."""
+        count = self._write_count
+        frames = self._frames
+        if count == 0 or frames is None:
+            return None
+        return frames[(count - 1) % self._ring_size].copy()
 
-        duration = len(all_frames) / self._fps
+
+class ClipWriter(QThread):
+    """Encodes finished clips off the capture thread.
+
+    Jobs reference frames in the capture ring by slot index rather than
+    copying them. Each slot is released through the job's callback as
+    soon as it has been encoded, oldest first, which is the order the
+    capture loop will next want to reuse them.
+
+    Signals:
+        clip_saved(str): Emitted when a clip is written, with the file path.
+    """
+
+    clip_saved = pyqtSignal(str)         # file path
+
+    def __init__(self, max_pending: int = 2, parent=None):
+        super().__init__(parent)
+        self._jobs: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._stop_requested = False
+
+    def submit(self, frames: np.ndarray, slots: list[int], filepath: Path,
+               fps: int, release) -> bool:
+        """Queue a clip without blocking.
+
+        Args:
+            frames: The ring array holding the clip's frames.
+            slots: Ring slot indices in playback order.
+            filepath: Output MP4 path.
+            fps: Clip frame rate.
+            release: Called with each slot index once it has been written
+                (or skipped); the caller must keep those slots intact
+                until then.
+
+        Returns:
+            False if the queue is full and the clip was not accepted.
+        """
+        try:
+            self._jobs.put_nowait((frames, slots, filepath, fps, release))
+        except queue.Full:
+            return False
+        return True
+
+    def run(self):
+        """Write queued clips until stop() is called."""
+        while True:
+            try:
+                job = self._jobs.get(timeout=CLIP_WRITER_POLL_S)
+            except queue.Empty:
+                if self._stop_requested:
+                    break
+                continue
+            if job is None:
+                break
+            # One bad clip (encoder or disk error) must not end the thread
+            try:
+                self._write_clip(*job)
+            except Exception:
+                logger.exception(f"Failed to write clip {job[2]}")
+
+    def stop(self):
+        """Finish pending clips, then exit the thread."""
+        self._stop_requested = True
+        try:
+            self._jobs.put_nowait(None)
+        except queue.Full:
+            pass  # run() exits once the queue has drained
+
+    def _write_clip(self, frames: np.ndarray, slots: list[int],
+                    filepath: Path, fps: int, release):
+        """Encode one clip, releasing each ring slot as it is consumed.
+
+        Every slot is released even if encoding fails part-way, since
+        the capture loop drops frames while a slot is still locked.
+        """
+        height, width = frames.shape[1:3]
+        done = 0
+        writer = None
+        try:
+            writer = self._make_writer(filepath, fps, width, height)
+            if writer is None:
+                logger.error(f"Cannot create video writer for {filepath}")
+                return
+            for slot in slots:
+                writer.write(frames[slot])
+                done += 1
+                release(slot)
+        finally:
+            for slot in slots[done:]:
+                release(slot)
+            if writer is not None:
+                writer.release()
+
+        duration = len(slots) / fps
         logger.info(
             f"Clip saved: {filepath} "
-            f"({len(all_frames)} frames, {duration:.1f}s)"
+            f"({len(slots)} frames, {duration:.1f}s)"
         )
         self.clip_saved.emit(str(filepath))
 
-    def stop(self):
-        """Signal the thread to stop."""
-        self._running = False
+    def _make_writer(self, filepath: Path, fps: int, width: int, height: int):
+        """Open a clip writer, preferring a hardware H.264 encoder.
 
-    def get_latest_frame(self) -> Optional[np.ndarray]:
-        """Get the most recent frame from the buffer (thread-safe)."""
-        with QMutexLocker(self._buffer_mutex):
-            if self._buffer:
-                return self._buffer[-1][0].copy()
-        return None
+        On Jetson, tries the GStreamer NVENC pipeline first. Otherwise
+        tries each of HW_ENCODERS through PyAV (if installed), then falls
+        back to OpenCV's mp4v writer.
+
+        Returns:
+            An object with write(frame) and release(), or None on failure.
+        """
+        if _jetson_encoder_available():
+            pipeline = JETSON_PIPELINE.format(
+                width=width, height=height, fps=fps, path=filepath
+            )
+            writer = cv2.VideoWriter(
+                pipeline, cv2.CAP_GSTREAMER, 0, fps, (width, height)
+            )
+            if writer.isOpened():
+                logger.debug("Clip writer: GStreamer nvv4l2h264enc")
+                return writer
+            logger.debug("GStreamer NVENC pipeline failed to open")
+
+        if av is not None:
+            for codec in HW_ENCODERS:
+                try:
+                    return _AVClipWriter(filepath, codec, fps,
+                                         width, height)
+                except (av.FFmpegError, ValueError) as e:
+                    logger.debug(f"Encoder {codec} unavailable: {e}")
+
+        fourcc = cv2.VideoWriter.fourcc(*"mp4v")
+        writer = cv2.VideoWriter(
+            str(filepath), fourcc, fps, (width, height)
+        )
+        if not writer.isOpened():
+            return None
+        return writer
+
+
+@functools.lru_cache(maxsize=1)
+def _jetson_encoder_available() -> bool:
+    """True on aarch64 hosts with nvv4l2h264enc and a GStreamer-enabled
+    OpenCV build. Probed once per process."""
+    if platform.machine() != "aarch64":
+        return False
+    if not re.search(r"GStreamer:\s*YES", cv2.getBuildInformation()):
+        return False
+    inspect = shutil.which("gst-inspect-1.0")
+    if inspect is None:
+        return False
+    try:
+        result = subprocess.run(
+            [inspect, "nvv4l2h264enc"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+class _AVClipWriter:
+    """PyAV-backed MP4 writer with the same write()/release() surface as
+    cv2.VideoWriter, used for hardware H.264 encoders."""
+
+    def __init__(self, filepath: Path, codec: str, fps: int,
+                 width: int, height: int):
+        self._container = av.open(str(filepath), mode="w")
+        try:
+            self._stream = self._container.add_stream(codec, rate=fps)
+            self._stream.width = width
+            self._stream.height = height
+            self._stream.pix_fmt = "yuv420p"
+            # Open now so a missing GPU/driver fails here, not mid-clip
+            self._stream.codec_context.open()
+        except Exception:
+            self._container.close()
+            filepath.unlink(missing_ok=True)
+            raise
+        logger.debug(f"Clip writer: {codec}")
+
+    def write(self, frame: np.ndarray):
+        """Encode one BGR frame."""
+        yuv = cv2.cvtColor(frame, cv2.COLOR_BGR2YUV_I420)
+        av_frame = av.VideoFrame.from_ndarray(yuv, format="yuv420p")
+        self._container.mux(self._stream.encode(av_frame))
+
+    def release(self):
+        """Flush the encoder and close the file."""
+        self._container.mux(self._stream.encode(None))
+        self._container.close()
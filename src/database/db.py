@@ -5,12 +5,17 @@ Handles persistence of sessions, shots, and AI feedback.
 Database file: ~/.ironsight/ironsight.db
 """
 
+import functools
 import json
 import logging
 import sqlite3
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Final, Optional
+
+import numpy as np
 
 from src.models.shot import ClubData, BallLaunch, Shot, TrajectoryResult
 from src.models.session import Session
@@ -20,95 +25,279 @@ logger = logging.getLogger(__name__)
 
 SCHEMA_FILE = Path(__file__).parent / "schema.sql"
 
+# Trajectory points are stored as little-endian int16 tenths of a yard.
+# compute_trajectory already rounds to 0.1 yd, so this is lossless and
+# ~6 bytes/point instead of ~20 for JSON text.
+TRAJECTORY_SCALE = 10.0
+TRAJECTORY_DTYPE = np.dtype("<i2")
+
+# PRAGMA user_version: bumped whenever _migrate() gains a step
+SCHEMA_VERSION = 3
+
+
+def _pack_points(points) -> bytes:
+    """Encode trajectory points as a compact int16 BLOB."""
+    arr = np.rint(np.asarray(points, dtype=np.float64) * TRAJECTORY_SCALE)
+    return arr.astype(TRAJECTORY_DTYPE).tobytes()
+
+
+def _unpack_points(raw) -> np.ndarray:
+    """Decode a stored trajectory (int16 BLOB, or legacy JSON text).
+
+    Returns:
+        (N, 3) float32 array, as in TrajectoryResult.points.
+    """
+    if isinstance(raw, (bytes, memoryview)):
+        arr = np.frombuffer(raw, dtype=TRAJECTORY_DTYPE).reshape(-1, 3)
+        return (arr / TRAJECTORY_SCALE).astype(np.float32)
+    return np.asarray(json.loads(raw), dtype=np.float32).reshape(-1, 3)
+
+
+def _synchronized(method):
+    """Run a Database method while holding the connection lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
 
 class Database:
-    """SQLite database wrapper for IronSight data persistence."""
+    """SQLite database wrapper for IronSight data persistence.
+
+    The connection runs in autocommit mode: each write method commits on
+    its own unless called inside `with db.transaction():`, in which case
+    everything is committed together when the outermost block exits.
+
+    Thread-safe: the connection is shared by all threads and every public
+    method (and a whole transaction() block) holds a re-entrant lock, so
+    calls from the GUI, camera and AI threads are serialized, matching
+    SQLite's single-writer model.
+    """
+
+    _tx_depth = 0
+
+    # Hot-path statements, kept as constants so every call hands sqlite3
+    # the identical string and hits its prepared-statement cache.
+    _SHOT_INSERT_SQL: Final[str] = """
+        INSERT INTO shots (
+            session_id, timestamp, ts_epoch,
+            club_type, club_speed_mph, face_angle_deg, path_deg,
+            contact_point, tempo,
+            ball_speed_mph, vla_deg, hla_deg, backspin_rpm, spin_axis_deg,
+            carry_yards, total_yards, apex_yards, lateral_yards,
+            flight_time_s, shot_shape, video_path, trajectory_json
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    _SHOTS_SELECT_SQL: Final[str] = """
+        SELECT id, session_id, timestamp, ts_epoch,
+               club_type, club_speed_mph, face_angle_deg, path_deg,
+               contact_point, tempo,
+               ball_speed_mph, vla_deg, hla_deg, backspin_rpm, spin_axis_deg,
+               carry_yards, total_yards, apex_yards, lateral_yards,
+               flight_time_s, shot_shape, video_path, trajectory_json
+        FROM shots WHERE session_id = ? ORDER BY timestamp
+    """
+    _SESSIONS_SELECT_SQL: Final[str] = """
+        SELECT s.id, s.start_time, s.end_time, s.notes,
+               COUNT(sh.id) as num_shots
+        FROM sessions s
+        LEFT JOIN shots sh ON sh.session_id = s.id
+        GROUP BY s.id
+        ORDER BY s.start_time DESC
+        LIMIT ?
+    """
+    _FEEDBACK_INSERT_SQL: Final[str] = """
+        INSERT INTO ai_feedback
+            (shot_id, session_id, feedback_type, prompt, response, model, tokens_used)
+        VALUES (:shot_id, :session_id, :feedback_type, :prompt, :response, :model, :tokens)
+    """
+    _CACHE_SELECT_SQL: Final[str] = "SELECT response FROM ai_cache WHERE key = ?"
+    _CACHE_UPSERT_SQL: Final[str] = """
+        INSERT OR REPLACE INTO ai_cache (key, model, response, tokens_used)
+        VALUES (?, ?, ?, ?)
+    """
 
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or Config.get_db_path()
         self.conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self._init_db()
 
     def _init_db(self):
         """Initialize database connection and create tables."""
-        self.conn = sqlite3.connect(str(self.db_path))
+        # Autocommit mode: single statements commit on their own and
+        # multi-statement writes use transaction(), so the driver never
+        # inserts implicit BEGINs
+        self.conn = sqlite3.connect(
+            str(self.db_path), isolation_level=None, check_same_thread=False
+        )
         self.conn.row_factory = sqlite3.Row
+        self._cur = self.conn.cursor()
         self.conn.execute("PRAGMA journal_mode=WAL")
+        # NORMAL is crash-safe under WAL; it only skips the fsync per commit
+        self.conn.execute("PRAGMA synchronous=NORMAL")
         self.conn.execute("PRAGMA foreign_keys=ON")
 
         # Create tables from schema
         schema = SCHEMA_FILE.read_text()
         self.conn.executescript(schema)
-        self.conn.commit()
+        self._migrate()
         logger.info(f"Database initialized at {self.db_path}")
 
+    @_synchronized
     def close(self):
         """Close the database connection."""
         if self.conn:
             self.conn.close()
             self.conn = None
 
+    def _migrate(self):
+        """Bring an existing database file up to SCHEMA_VERSION."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        with self.transaction():
+            if version < 1:
+                # v1: trajectories stored as packed int16 BLOBs, not JSON
+                rows = self.conn.execute(
+                    "SELECT id, trajectory_json FROM shots "
+                    "WHERE typeof(trajectory_json) = 'text'"
+                ).fetchall()
+                self.conn.executemany(
+                    "UPDATE shots SET trajectory_json = ? WHERE id = ?",
+                    [(_pack_points(_unpack_points(r["trajectory_json"])), r["id"])
+                     for r in rows],
+                )
+                if rows:
+                    logger.info(f"Packed {len(rows)} legacy trajectories")
+            if version < 2:
+                # v2: idx_shots_session superseded by idx_shots_session_ts
+                self.conn.execute("DROP INDEX IF EXISTS idx_shots_session")
+            if version < 3:
+                # v3: numeric ts_epoch alongside the ISO timestamp
+                columns = {
+                    r["name"] for r in self.conn.execute("PRAGMA table_info(shots)")
+                }
+                if "ts_epoch" not in columns:
+                    self.conn.execute("ALTER TABLE shots ADD COLUMN ts_epoch REAL")
+                rows = self.conn.execute(
+                    "SELECT id, timestamp FROM shots WHERE ts_epoch IS NULL"
+                ).fetchall()
+                self.conn.executemany(
+                    "UPDATE shots SET ts_epoch = ? WHERE id = ?",
+                    [(datetime.fromisoformat(r["timestamp"]).timestamp(), r["id"])
+                     for r in rows],
+                )
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @contextmanager
+    def transaction(self):
+        """Group several writes into one transaction (and one commit).
+
+        Nested blocks join the outermost transaction. Rolls back if the
+        block raises. Other threads wait until the block exits.
+        """
+        with self._lock:
+            if self._tx_depth == 0:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._tx_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self.conn.rollback()
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self.conn.commit()
+
     # =========================================================================
     # Sessions
     # =========================================================================
 
+    @_synchronized
     def create_session(self, session: Session) -> int:
         """Create a new session and return its ID."""
         cur = self.conn.execute(
             "INSERT INTO sessions (start_time, notes) VALUES (?, ?)",
             (session.start_time.isoformat(), session.notes),
         )
-        self.conn.commit()
         session.id = cur.lastrowid
         logger.info(f"Session created: id={session.id}")
         return session.id
 
-    def end_session(self, session_id: int):
-        """Mark a session as ended."""
+    @_synchronized
+    def end_session(self, session_id: int,
+                    end_time: Optional[datetime] = None):
+        """Mark a session as ended.
+
+        Args:
+            session_id: Session to close.
+            end_time: When it ended; pass Session.end_time so the stored
+                value matches the in-memory model. Defaults to now.
+        """
         self.conn.execute(
             "UPDATE sessions SET end_time = ? WHERE id = ?",
-            (datetime.now().isoformat(), session_id),
+            ((end_time or datetime.now()).isoformat(), session_id),
         )
-        self.conn.commit()
 
+    @_synchronized
     def get_sessions(self, limit: int = 20) -> list[dict]:
         """Get recent sessions with shot counts."""
-        rows = self.conn.execute("""
-            SELECT s.id, s.start_time, s.end_time, s.notes,
-                   COUNT(sh.id) as num_shots
-            FROM sessions s
-            LEFT JOIN shots sh ON sh.session_id = s.id
-            GROUP BY s.id
-            ORDER BY s.start_time DESC
-            LIMIT ?
-        """, (limit,)).fetchall()
+        rows = self._cur.execute(
+            self._SESSIONS_SELECT_SQL, (limit,)
+        ).fetchall()
         return [dict(r) for r in rows]
 
     # =========================================================================
     # Shots
     # =========================================================================
 
+    @_synchronized
     def save_shot(self, shot: Shot) -> int:
         """Save a shot to the database and return its ID."""
+        return self.save_shots([shot])[0]
+
+    @_synchronized
+    def save_shots(self, shots: list[Shot]) -> list[int]:
+        """Save several shots with one statement and one commit.
+
+        Sets each shot's id and returns the ids in input order.
+        """
+        if not shots:
+            return []
+
+        with self.transaction():
+            self._cur.executemany(
+                self._SHOT_INSERT_SQL,
+                [self._shot_params(shot) for shot in shots],
+            )
+            # The write lock is held for the whole transaction, so the
+            # AUTOINCREMENT ids of this batch are consecutive
+            last_id = self._cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        first_id = last_id - len(shots) + 1
+        for offset, shot in enumerate(shots):
+            shot.id = first_id + offset
+        return [shot.id for shot in shots]
+
+    @staticmethod
+    def _shot_params(shot: Shot) -> tuple:
+        """Flatten a Shot into INSERT INTO shots parameters."""
         cd = shot.club_data
         bl = shot.ball_launch
         tr = shot.trajectory
 
-        traj_json = None
-        if tr and tr.points:
-            traj_json = json.dumps(tr.points)
-
-        cur = self.conn.execute("""
-            INSERT INTO shots (
-                session_id, timestamp,
-                club_type, club_speed_mph, face_angle_deg, path_deg,
-                contact_point, tempo,
-                ball_speed_mph, vla_deg, hla_deg, backspin_rpm, spin_axis_deg,
-                carry_yards, total_yards, apex_yards, lateral_yards,
-                flight_time_s, shot_shape, video_path, trajectory_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        traj_blob = None
+        if tr and len(tr.points):
+            traj_blob = _pack_points(tr.points)
+
+        return (
             shot.session_id, shot.timestamp.isoformat(),
+            shot.timestamp.timestamp(),
             cd.club_type, cd.club_speed_mph, cd.face_angle_deg, cd.path_deg,
             cd.contact_point, cd.tempo,
             bl.ball_speed_mph if bl else None,
@@ -119,17 +308,14 @@ class Database:
             shot.carry_yards, shot.total_yards, shot.apex_yards,
             shot.lateral_yards,
             tr.flight_time_s if tr else None,
-            shot.shot_shape, shot.video_path, traj_json,
-        ))
-        self.conn.commit()
-        shot.id = cur.lastrowid
-        return shot.id
+            shot.shot_shape, shot.video_path, traj_blob,
+        )
 
+    @_synchronized
     def get_shots(self, session_id: int) -> list[Shot]:
         """Get all shots for a session."""
-        rows = self.conn.execute(
-            "SELECT * FROM shots WHERE session_id = ? ORDER BY timestamp",
-            (session_id,),
+        rows = self._cur.execute(
+            self._SHOTS_SELECT_SQL, (session_id,)
         ).fetchall()
 
         shots = []
@@ -153,8 +339,7 @@ class Database:
                 )
             tr = None
             if r["trajectory_json"]:
-                points = json.loads(r["trajectory_json"])
-                points = [tuple(p) for p in points]
+                points = _unpack_points(r["trajectory_json"])
                 tr = TrajectoryResult(
                     points=points,
                     carry_yards=r["carry_yards"],
@@ -175,11 +360,16 @@ class Database:
                 video_path=r["video_path"],
                 id=r["id"],
                 session_id=r["session_id"],
-                timestamp=datetime.fromisoformat(r["timestamp"]),
+                timestamp=(
+                    datetime.fromtimestamp(r["ts_epoch"])
+                    if r["ts_epoch"] is not None
+                    else datetime.fromisoformat(r["timestamp"])
+                ),
             )
             shots.append(shot)
         return shots
 
+    @_synchronized
     def get_session_stats(self, session_id: int) -> dict:
         """Get aggregate stats for a session."""
         row = self.conn.execute("""
@@ -199,6 +389,7 @@ class Database:
     # AI Feedback
     # =========================================================================
 
+    @_synchronized
     def save_ai_feedback(
         self,
         shot_id: Optional[int],
@@ -210,14 +401,42 @@ class Database:
         tokens: int = 0,
     ) -> int:
         """Save AI coaching feedback."""
-        cur = self.conn.execute("""
-            INSERT INTO ai_feedback
-                (shot_id, session_id, feedback_type, prompt, response, model, tokens_used)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (shot_id, session_id, feedback_type, prompt, response, model, tokens))
-        self.conn.commit()
-        return cur.lastrowid
+        self._cur.execute(self._FEEDBACK_INSERT_SQL, {
+            "shot_id": shot_id,
+            "session_id": session_id,
+            "feedback_type": feedback_type,
+            "prompt": prompt,
+            "response": response,
+            "model": model,
+            "tokens": tokens,
+        })
+        return self._cur.lastrowid
+
+    @_synchronized
+    def save_ai_feedback_many(self, records: list[dict]):
+        """Save several AI feedback records in one transaction.
+
+        Args:
+            records: Dicts with the same keys as save_ai_feedback's arguments.
+        """
+        if not records:
+            return
+        with self.transaction():
+            self._cur.executemany(self._FEEDBACK_INSERT_SQL, records)
+
+    @_synchronized
+    def get_cached_response(self, key: str) -> Optional[str]:
+        """Look up a cached AI response by request hash."""
+        row = self._cur.execute(self._CACHE_SELECT_SQL, (key,)).fetchone()
+        return row["response"] if row else None
+
+    @_synchronized
+    def save_cached_response(self, key: str, model: str, response: str,
+                             tokens: int = 0):
+        """Store an AI response under its request hash."""
+        self._cur.execute(self._CACHE_UPSERT_SQL, (key, model, response, tokens))
 
+    @_synchronized
     def get_ai_feedback(self, shot_id: Optional[int] = None,
                         session_id: Optional[int] = None) -> list[dict]:
         """Get AI feedback for a shot or session."""
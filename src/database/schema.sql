@@ -12,7 +12,8 @@ CREATE TABLE IF NOT EXISTS sessions (
 CREATE TABLE IF NOT EXISTS shots (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     session_id INTEGER NOT NULL,
-    timestamp TEXT NOT NULL,
+    timestamp TEXT NOT NULL,       -- ISO 8601, for display and ordering
+    ts_epoch REAL,                 -- same instant as Unix seconds (fast load)
 
     -- Club data (from OptiShot sensors)
     club_type TEXT NOT NULL,
@@ -40,7 +41,8 @@ CREATE TABLE IF NOT EXISTS shots (
     -- Video
     video_path TEXT,
 
-    -- Trajectory points (JSON array of [x, y, z])
+    -- Trajectory points: int16 BLOB of [x, y, z] in 0.1 yd
+    -- (older rows hold a JSON array of [x, y, z])
     trajectory_json TEXT,
 
     created_at TEXT DEFAULT (datetime('now')),
@@ -61,8 +63,18 @@ CREATE TABLE IF NOT EXISTS ai_feedback (
     FOREIGN KEY (session_id) REFERENCES sessions(id)
 );
 
+-- Responses cached by request hash so identical AI prompts are not re-sent
+CREATE TABLE IF NOT EXISTS ai_cache (
+    key TEXT PRIMARY KEY,          -- BLAKE2 hash of the full request
+    model TEXT NOT NULL,
+    response TEXT NOT NULL,
+    tokens_used INTEGER DEFAULT 0,
+    created_at TEXT DEFAULT (datetime('now'))
+);
+
 -- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_shots_session ON shots(session_id);
+-- (session_id, timestamp) serves both session filtering and get_shots' ORDER BY
+CREATE INDEX IF NOT EXISTS idx_shots_session_ts ON shots(session_id, timestamp);
 CREATE INDEX IF NOT EXISTS idx_shots_club ON shots(club_type);
 CREATE INDEX IF NOT EXISTS idx_ai_feedback_shot ON ai_feedback(shot_id);
 CREATE INDEX IF NOT EXISTS idx_ai_feedback_session ON ai_feedback(session_id);
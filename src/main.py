@@ -19,8 +19,6 @@ import logging
 import signal
 import sys
 
-from PyQt6.QtCore import QCoreApplication
-
 
 def setup_logging(verbose: bool = False):
     """Configure logging for the application."""
@@ -72,6 +70,10 @@ def create_reader(args):
 
 def run_cli(args):
     """Run in CLI mode: print shot data to console."""
+    # Imported here rather than at module level so --help and argument
+    # errors exit without loading Qt
+    from PyQt6.QtCore import QCoreApplication, QTimer
+
     app = QCoreApplication(sys.argv)
 
     reader = create_reader(args)
@@ -148,7 +150,6 @@ def run_cli(args):
 
     # Process Qt events (needed for signals to work)
     # Use a timer to check for SIGINT
-    from PyQt6.QtCore import QTimer
     timer = QTimer()
     timer.timeout.connect(lambda: None)  # Keep event loop alive
     timer.start(100)
@@ -9,28 +9,35 @@ Unified training interface with:
   - Club selector
 """
 
-import json
+import csv
 import logging
 import os
 import sys
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
-import cv2
 import numpy as np
 from PyQt6.QtCore import (
-    Qt, QTimer, QUrl, pyqtSignal, pyqtSlot, QSize,
+    Qt, QAbstractListModel, QModelIndex, QObject, QRect, QThread, QTimer, QUrl, pyqtSignal, pyqtSlot, QSize,
 )
-from PyQt6.QtGui import QImage, QPixmap, QAction, QFont, QColor
+from PyQt6.QtGui import QImage, QPainter, QAction, QFont, QColor
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QSplitter, QLabel, QPushButton, QComboBox, QTextEdit,
-    QListWidget, QListWidgetItem, QStatusBar, QToolBar,
+    QListView, QStatusBar, QToolBar,
     QFrame, QGroupBox, QGridLayout, QSlider, QFileDialog,
-    QMessageBox,
+    QMessageBox, QStackedWidget,
 )
+from PyQt6.QtWebChannel import QWebChannel
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 
+try:
+    from PyQt6.QtMultimedia import QMediaPlayer
+    from PyQt6.QtMultimediaWidgets import QVideoWidget
+except ImportError:  # optional: hardware-decoded clip playback
+    QMediaPlayer = None
+
 from src.ball_flight import compute_shot
 from src.models.shot import ClubData, Shot
 from src.models.session import Session
@@ -42,10 +49,147 @@ logger = logging.getLogger(__name__)
 VISUALIZER_DIR = Path(__file__).parent / "visualizer"
 VISUALIZER_HTML = VISUALIZER_DIR / "index.html"
 
+# Shots kept in memory and in the history list; older ones are dropped
+MAX_HISTORY_SHOTS = 500
+
+# Live preview repaint interval (~30 Hz); faster camera frames are coalesced
+PREVIEW_REFRESH_MS = 33
+
+
+class VizBridge(QObject):
+    """QWebChannel object exposed to the visualizer as `bridge`.
+
+    Signals:
+        shot_ready(dict): Shot payload for window.addShot(), delivered to
+            JS as a native object (no JSON string round-trip).
+    """
+
+    shot_ready = pyqtSignal("QVariantMap")
+
+
+class FrameView(QLabel):
+    """Video panel label that paints the latest frame itself.
+
+    The frame QImage is drawn straight into the widget, scaled to fit
+    with its aspect ratio kept, so displaying a frame allocates no scaled
+    copy or QPixmap. Until the first frame the label's text is shown.
+    """
+
+    _frame: Optional[QImage] = None
+
+    def set_frame(self, image: QImage):
+        """Show `image` on the next repaint."""
+        if self._frame is None:
+            self.clear()  # Drop the placeholder text
+        self._frame = image
+        self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._frame is None:
+            return
+        area = self.contentsRect()
+        rect = QRect(area.topLeft(), self._frame.size().scaled(
+            area.size(), Qt.AspectRatioMode.KeepAspectRatio
+        ))
+        rect.moveCenter(area.center())
+        QPainter(self).drawImage(rect, self._frame)
+
+
+class ShotListModel(QAbstractListModel):
+    """Session history rows, backed directly by the window's shot deque.
+
+    Row text is formatted on demand for visible rows only; nothing is
+    stored per row. When the deque is full, appending drops the oldest
+    row, and `first_number` tracks the shot number of row 0.
+    """
+
+    def __init__(self, shots: deque, parent=None):
+        super().__init__(parent)
+        self._shots = shots
+        self.first_number = 1
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._shots)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        shot = self._shots[index.row()]
+        cd = shot.club_data
+        tr = shot.trajectory
+        return (
+            f"#{self.first_number + index.row()}  {cd.club_type:8s}  "
+            f"{tr.carry_yards:5.0f}yd  "
+            f"{shot.shot_shape:8s}  "
+            f"Speed: {cd.club_speed_mph}mph"
+        )
+
+    def append(self, shot: Shot):
+        """Add a shot as the last row, dropping the oldest if full."""
+        if len(self._shots) == self._shots.maxlen:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._shots.popleft()
+            self.first_number += 1
+            self.endRemoveRows()
+        row = len(self._shots)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._shots.append(shot)
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all shots."""
+        self.beginResetModel()
+        self._shots.clear()
+        self.first_number = 1
+        self.endResetModel()
+
+
+CSV_HEADER = [
+    "Shot#", "Club", "ClubSpeed_mph", "FaceAngle_deg",
+    "Path_deg", "BallSpeed_mph", "VLA_deg", "HLA_deg",
+    "Backspin_rpm", "SpinAxis_deg", "Carry_yd", "Total_yd",
+    "Apex_yd", "Lateral_yd", "ShotShape", "VideoPath",
+]
+
+
+class CsvExportWorker(QThread):
+    """Writes pre-built CSV rows to disk off the GUI thread.
+
+    Signals:
+        export_done(str, int): File path and number of rows written.
+        export_failed(str): Error message if the file can't be written.
+    """
+
+    export_done = pyqtSignal(str, int)
+    export_failed = pyqtSignal(str)
+
+    def __init__(self, path: str, rows: list[tuple], parent=None):
+        super().__init__(parent)
+        self._path = path
+        self._rows = rows
+
+    def run(self):
+        """Write the header and all rows."""
+        try:
+            with open(self._path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_HEADER)
+                writer.writerows(self._rows)
+        except OSError as e:
+            logger.error(f"CSV export failed: {e}")
+            self.export_failed.emit(str(e))
+            return
+        self.export_done.emit(self._path, len(self._rows))
+
 
 class MainWindow(QMainWindow):
     """Main application window for IronSight Golf Simulator."""
 
+    # Newest camera frame not yet painted (see _flush_frame)
+    _pending_frame: Optional[QImage] = None
+    _export_worker: Optional[CsvExportWorker] = None
+
     def __init__(self, reader, camera=None, parent=None):
         """
         Args:
@@ -56,8 +200,9 @@ class MainWindow(QMainWindow):
         self.reader = reader
         self.camera = camera
         self.session = Session()
-        self.shots: list[Shot] = []
-        self.current_shot_idx = -1
+        self.shots: deque[Shot] = deque(maxlen=MAX_HISTORY_SHOTS)
+        self._shot_count = 0  # Shots this session, including dropped ones
+        self.current_shot_idx = -1  # 0-based shot number, not deque index
 
         self.setWindowTitle("IronSight Golf Simulator")
         self.setMinimumSize(1200, 800)
@@ -88,6 +233,10 @@ class MainWindow(QMainWindow):
         url = QUrl.fromLocalFile(str(VISUALIZER_HTML.resolve()))
         self.web_view.setUrl(url)
         self.web_view.setMinimumWidth(600)
+        self._viz_bridge = VizBridge(self)
+        channel = QWebChannel(self.web_view.page())
+        channel.registerObject("bridge", self._viz_bridge)
+        self.web_view.page().setWebChannel(channel)
         content_splitter.addWidget(self.web_view)
 
         # Right: Video + Shot Data
@@ -99,14 +248,32 @@ class MainWindow(QMainWindow):
         # Video display
         video_group = QGroupBox("Swing Video")
         video_layout = QVBoxLayout(video_group)
-        self.video_label = QLabel("No camera")
+        self.video_label = FrameView("No camera")
         self.video_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.video_label.setMinimumSize(320, 240)
-        self.video_label.setStyleSheet(
-            "background-color: #1a1a2e; color: #666; "
-            "border: 1px solid #333; border-radius: 4px;"
-        )
-        video_layout.addWidget(self.video_label)
+        self.video_label.setObjectName("videoLabel")
+        self.video_stack = QStackedWidget()
+        self.video_stack.addWidget(self.video_label)
+        video_layout.addWidget(self.video_stack)
+
+        # Saved clips play through Qt Multimedia (platform GPU decoder)
+        # when available; otherwise _play_video decodes with OpenCV
+        self._media_player = None
+        if QMediaPlayer is not None:
+            self.video_widget = QVideoWidget()
+            self.video_stack.addWidget(self.video_widget)
+            self._media_player = QMediaPlayer(self)
+            self._media_player.setVideoOutput(self.video_widget)
+            self._media_player.mediaStatusChanged.connect(
+                self._on_media_status
+            )
+
+        # Paint only the newest camera frame at a fixed rate, so a fast
+        # camera can't back up the GUI thread's event queue
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setInterval(PREVIEW_REFRESH_MS)
+        self._frame_timer.timeout.connect(self._flush_frame)
+        self._frame_timer.start()
 
         # Playback controls
         playback_layout = QHBoxLayout()
@@ -134,15 +301,19 @@ class MainWindow(QMainWindow):
             ("Apex", "apex"), ("Lateral", "lateral"),
             ("Shot Shape", "shape"),
         ]
+        # Suspend repaints while the grid is filled in
+        shot_group.setUpdatesEnabled(False)
         for i, (label_text, key) in enumerate(stats):
             row, col = divmod(i, 2)
-            lbl = QLabel(f"<span style='color:#888;font-size:11px;'>{label_text}</span>")
-            val = QLabel("<span style='color:#4CAF50;font-size:16px;font-weight:bold;'>—</span>")
-            val.setTextFormat(Qt.TextFormat.RichText)
-            lbl.setTextFormat(Qt.TextFormat.RichText)
+            lbl = QLabel(label_text)
+            lbl.setObjectName("shotCaption")
+            val = QLabel("—")
+            val.setTextFormat(Qt.TextFormat.PlainText)
+            val.setObjectName("shotValue")
             shot_grid.addWidget(lbl, row, col * 2)
             shot_grid.addWidget(val, row, col * 2 + 1)
             self.shot_labels[key] = val
+        shot_group.setUpdatesEnabled(True)
 
         right_layout.addWidget(shot_group)
         right_panel.setMaximumWidth(400)
@@ -155,16 +326,19 @@ class MainWindow(QMainWindow):
         history_group = QGroupBox("Session History")
         history_layout = QVBoxLayout(history_group)
         history_layout.setContentsMargins(4, 4, 4, 4)
-        self.shot_list = QListWidget()
+        self.history_model = ShotListModel(self.shots, parent=self)
+        self.shot_list = QListView()
+        self.shot_list.setModel(self.history_model)
+        self.shot_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self.shot_list.setMaximumHeight(150)
         self.shot_list.setAlternatingRowColors(True)
-        self.shot_list.setStyleSheet(
-            "QListWidget { background-color: #1e1e2e; color: #e0e0e0; "
-            "border: 1px solid #333; font-size: 13px; }"
-            "QListWidget::item:selected { background-color: #2d5a1e; }"
-            "QListWidget::item:alternate { background-color: #252540; }"
-        )
-        self.shot_list.itemClicked.connect(self._on_shot_selected)
+        # All rows are one line of the same font: skip per-item size
+        # queries and lay out incrementally as the session grows
+        self.shot_list.setUniformItemSizes(True)
+        self.shot_list.setLayoutMode(QListView.LayoutMode.Batched)
+        self.shot_list.setBatchSize(64)
+        self.shot_list.setObjectName("shotHistory")
+        self.shot_list.clicked.connect(self._on_shot_selected)
         history_layout.addWidget(self.shot_list)
         main_layout.addWidget(history_group, stretch=1)
 
@@ -180,7 +354,7 @@ class MainWindow(QMainWindow):
 
         # Club selector
         club_label = QLabel(" Club: ")
-        club_label.setStyleSheet("color: #ccc; font-weight: bold;")
+        club_label.setObjectName("clubLabel")
         toolbar.addWidget(club_label)
 
         self.club_combo = QComboBox()
@@ -221,7 +395,11 @@ class MainWindow(QMainWindow):
         toolbar.addWidget(btn_export)
 
     def _apply_dark_theme(self):
-        """Apply a dark color scheme."""
+        """Apply a dark color scheme.
+
+        All widget styling lives in this one sheet (widgets are matched
+        by object name), so Qt parses CSS once rather than per widget.
+        """
         self.setStyleSheet("""
             QMainWindow { background-color: #1e1e2e; }
             QWidget { color: #e0e0e0; }
@@ -263,6 +441,27 @@ class MainWindow(QMainWindow):
             }
             QComboBox::drop-down { border: none; }
             QStatusBar { background-color: #1a1a2e; color: #888; }
+            QLabel#clubLabel { color: #ccc; font-weight: bold; }
+            QLabel#videoLabel {
+                background-color: #1a1a2e;
+                color: #666;
+                border: 1px solid #333;
+                border-radius: 4px;
+            }
+            QLabel#shotCaption { color: #888; font-size: 11px; }
+            QLabel#shotValue {
+                color: #4CAF50;
+                font-size: 16px;
+                font-weight: bold;
+            }
+            QListView#shotHistory {
+                background-color: #1e1e2e;
+                color: #e0e0e0;
+                border: 1px solid #333;
+                font-size: 13px;
+            }
+            QListView#shotHistory::item:selected { background-color: #2d5a1e; }
+            QListView#shotHistory::item:alternate { background-color: #252540; }
         """)
 
     def _connect_signals(self):
@@ -306,10 +505,10 @@ class MainWindow(QMainWindow):
         )
         shot.compute_shape()
 
-        # Store shot
-        self.shots.append(shot)
+        # Record shot (stored in self.shots by _add_to_history)
         self.session.add_shot(shot)
-        self.current_shot_idx = len(self.shots) - 1
+        self._shot_count += 1
+        self.current_shot_idx = self._shot_count - 1
 
         # Trigger camera clip extraction
         if self.camera:
@@ -322,25 +521,32 @@ class MainWindow(QMainWindow):
         self._update_shot_panel(shot)
 
         # Add to session history
-        self._add_to_history(shot, len(self.shots))
+        self._add_to_history(shot)
 
         self.statusBar().showMessage(
-            f"Shot #{len(self.shots)}: {club_data.club_type} "
+            f"Shot #{self._shot_count}: {club_data.club_type} "
             f"| Carry: {trajectory.carry_yards}yd "
             f"| {shot.shot_shape}"
         )
         logger.info(
-            f"Shot #{len(self.shots)}: {club_data.club_type} "
+            f"Shot #{self._shot_count}: {club_data.club_type} "
             f"{trajectory.carry_yards}yd {shot.shot_shape}"
         )
 
     def _send_shot_to_viz(self, shot: Shot):
-        """Send shot data to the Three.js visualizer via JS bridge."""
+        """Send shot data to the Three.js visualizer via the web channel."""
         if not shot.trajectory:
             return
 
-        shot_json = json.dumps({
-            "points": shot.trajectory.points,
+        # Flat [x0, y0, z0, x1, ...] so JS builds one Float32Array and
+        # hands it straight to the geometry. Rounded to 0.01 yd in float64:
+        # float32 values widen to long decimals (3.4 -> 3.4000000953...)
+        # and would double the JSON payload.
+        points = np.round(
+            np.asarray(shot.trajectory.points, dtype=np.float64), 2
+        )
+        self._viz_bridge.shot_ready.emit({
+            "points": points.ravel().tolist(),
             "carry": shot.trajectory.carry_yards,
             "total": shot.trajectory.total_yards,
             "apex": shot.trajectory.apex_yards,
@@ -354,17 +560,10 @@ class MainWindow(QMainWindow):
             "shotShape": shot.shot_shape,
         })
 
-        self.web_view.page().runJavaScript(
-            f"window.addShot({shot_json})"
-        )
-
     def _update_shot_panel(self, shot: Shot):
         """Update the shot data display panel."""
         def fmt(key, val, unit=""):
-            self.shot_labels[key].setText(
-                f"<span style='color:#4CAF50;font-size:16px;"
-                f"font-weight:bold;'>{val}{unit}</span>"
-            )
+            self.shot_labels[key].setText(f"{val}{unit}")
 
         cd = shot.club_data
         bl = shot.ball_launch
@@ -383,26 +582,23 @@ class MainWindow(QMainWindow):
         fmt("lateral", f"{abs(lat):.1f} {lat_dir}", " yd")
         fmt("shape", shot.shot_shape, "")
 
-    def _add_to_history(self, shot: Shot, num: int):
-        """Add a shot to the session history list."""
-        cd = shot.club_data
-        tr = shot.trajectory
-        text = (
-            f"#{num}  {cd.club_type:8s}  "
-            f"{tr.carry_yards:5.0f}yd  "
-            f"{shot.shot_shape:8s}  "
-            f"Speed: {cd.club_speed_mph}mph"
-        )
-        item = QListWidgetItem(text)
-        item.setData(Qt.ItemDataRole.UserRole, num - 1)  # Store index
-        self.shot_list.addItem(item)
-        self.shot_list.scrollToBottom()
+    def _add_to_history(self, shot: Shot):
+        """Store a shot and show it in the session history list."""
+        # Follow new shots only if the user hasn't scrolled up
+        bar = self.shot_list.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum()
+        self.history_model.append(shot)
+        if at_bottom:
+            self.shot_list.scrollToBottom()
 
-    def _on_shot_selected(self, item: QListWidgetItem):
+    def _on_shot_selected(self, index: QModelIndex):
         """Handle clicking on a shot in the history list."""
-        idx = item.data(Qt.ItemDataRole.UserRole)
-        if 0 <= idx < len(self.shots):
-            shot = self.shots[idx]
+        pos = index.row()
+        idx = self.history_model.first_number - 1 + pos  # 0-based shot number
+        if idx == self.current_shot_idx:
+            return  # Already displayed; don't re-add its trail
+        if 0 <= pos < len(self.shots):
+            shot = self.shots[pos]
             self._update_shot_panel(shot)
             # Re-animate this shot's trajectory
             self._send_shot_to_viz(shot)
@@ -412,30 +608,45 @@ class MainWindow(QMainWindow):
             if shot.video_path and os.path.exists(shot.video_path):
                 self._play_video(shot.video_path)
 
-    @pyqtSlot(object)
-    def _on_camera_frame(self, frame: np.ndarray):
-        """Display a live camera frame in the video panel."""
-        rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb.shape
-        bytes_per_line = ch * w
-        q_img = QImage(rgb.data, w, h, bytes_per_line, QImage.Format.Format_RGB888)
-        pixmap = QPixmap.fromImage(q_img).scaled(
-            self.video_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation,
-        )
-        self.video_label.setPixmap(pixmap)
+    @pyqtSlot(QImage)
+    def _on_camera_frame(self, image: QImage):
+        """Queue a live camera frame; the repaint timer shows the newest."""
+        self._pending_frame = image
+
+    def _flush_frame(self):
+        """Paint the pending camera frame, if a new one has arrived."""
+        image, self._pending_frame = self._pending_frame, None
+        if image is not None:
+            self._show_frame(image)
+
+    def _show_frame(self, image: QImage):
+        """Display a frame in the video panel.
+
+        Frames arrive as BGR888 QImages, so no colour conversion is
+        needed; FrameView scales them to fit while painting.
+        """
+        self.video_label.set_frame(image)
 
     @pyqtSlot(str)
     def _on_clip_saved(self, path: str):
         """Associate a saved clip with the most recent shot."""
         if self.shots:
             self.shots[-1].video_path = path
-            logger.info(f"Video clip linked to shot #{len(self.shots)}: {path}")
+            logger.info(f"Video clip linked to shot #{self._shot_count}: {path}")
 
     def _play_video(self, video_path: str):
         """Play a video clip in the video panel."""
-        cap = cv2.VideoCapture(video_path)
+        if self._media_player is not None:
+            self.video_stack.setCurrentWidget(self.video_widget)
+            self._media_player.setSource(QUrl.fromLocalFile(video_path))
+            self._media_player.play()
+            return
+
+        # OpenCV is only needed for this fallback; import it on first use
+        import cv2
+        from src.utils.video import bgr_to_qimage, open_capture
+
+        cap = open_capture(video_path)
         if not cap.isOpened():
             return
 
@@ -445,13 +656,19 @@ class MainWindow(QMainWindow):
         def show_frame():
             ret, frame = cap.read()
             if ret:
-                self._on_camera_frame(frame)
+                self._show_frame(bgr_to_qimage(frame))
                 QTimer.singleShot(frame_delay, show_frame)
             else:
                 cap.release()
 
         show_frame()
 
+    def _on_media_status(self, status):
+        """Return to the live camera view when clip playback ends."""
+        if status in (QMediaPlayer.MediaStatus.EndOfMedia,
+                      QMediaPlayer.MediaStatus.InvalidMedia):
+            self.video_stack.setCurrentWidget(self.video_label)
+
     def _on_club_changed(self, club_name: str):
         """Handle club selector change."""
         self.reader.set_club(club_name)
@@ -469,20 +686,40 @@ class MainWindow(QMainWindow):
     def _clear_shots(self):
         """Clear all shots from the visualization and history."""
         self.web_view.page().runJavaScript("window.clearShots()")
-        self.shot_list.clear()
-        self.shots.clear()
+        self.history_model.clear()
+        self._shot_count = 0
         self.current_shot_idx = -1
         # Reset shot data panel
-        for key, label in self.shot_labels.items():
-            label.setText(
-                "<span style='color:#4CAF50;font-size:16px;"
-                "font-weight:bold;'>—</span>"
-            )
+        for label in self.shot_labels.values():
+            label.setText("—")
         self.statusBar().showMessage("Shots cleared")
 
+    def _export_rows(self) -> list[tuple]:
+        """CSV rows for every shot since the last clear, numbered from 1.
+
+        Built from the session rather than self.shots, which only keeps
+        the last MAX_HISTORY_SHOTS.
+        """
+        start = len(self.session.shots) - self._shot_count
+        shots = self.session.shots[start:]
+        return [
+            (
+                i, s.club_data.club_type, s.club_data.club_speed_mph,
+                s.club_data.face_angle_deg, s.club_data.path_deg,
+                *((s.ball_launch.ball_speed_mph, s.ball_launch.vla_deg,
+                   s.ball_launch.hla_deg, s.ball_launch.backspin_rpm,
+                   s.ball_launch.spin_axis_deg)
+                  if s.ball_launch else ("",) * 5),
+                s.carry_yards, s.total_yards,
+                s.apex_yards, s.lateral_yards,
+                s.shot_shape, s.video_path or "",
+            )
+            for i, s in enumerate(shots, 1)
+        ]
+
     def _export_csv(self):
         """Export session data to CSV."""
-        if not self.shots:
+        if not self._shot_count:
             QMessageBox.information(self, "Export", "No shots to export.")
             return
 
@@ -492,32 +729,21 @@ class MainWindow(QMainWindow):
         if not path:
             return
 
-        import csv
-        with open(path, 'w', newline='') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "Shot#", "Club", "ClubSpeed_mph", "FaceAngle_deg",
-                "Path_deg", "BallSpeed_mph", "VLA_deg", "HLA_deg",
-                "Backspin_rpm", "SpinAxis_deg", "Carry_yd", "Total_yd",
-                "Apex_yd", "Lateral_yd", "ShotShape", "VideoPath",
-            ])
-            for i, s in enumerate(self.shots, 1):
-                cd = s.club_data
-                bl = s.ball_launch
-                writer.writerow([
-                    i, cd.club_type, cd.club_speed_mph,
-                    cd.face_angle_deg, cd.path_deg,
-                    bl.ball_speed_mph if bl else "",
-                    bl.vla_deg if bl else "",
-                    bl.hla_deg if bl else "",
-                    bl.backspin_rpm if bl else "",
-                    bl.spin_axis_deg if bl else "",
-                    s.carry_yards, s.total_yards,
-                    s.apex_yards, s.lateral_yards,
-                    s.shot_shape, s.video_path or "",
-                ])
-
-        self.statusBar().showMessage(f"Exported {len(self.shots)} shots to {path}")
+        # Snapshot the rows here (shots may change while the file is
+        # written); the disk I/O runs on a worker thread
+        rows = self._export_rows()
+
+        self._export_worker = CsvExportWorker(path, rows, parent=self)
+        self._export_worker.export_done.connect(
+            lambda p, n: self.statusBar().showMessage(
+                f"Exported {n} shots to {p}"
+            )
+        )
+        self._export_worker.export_failed.connect(
+            lambda msg: self.statusBar().showMessage(f"Export failed: {msg}")
+        )
+        self._export_worker.start()
+        self.statusBar().showMessage(f"Exporting {len(rows)} shots...")
 
     def closeEvent(self, event):
         """Clean up threads on window close."""
@@ -526,6 +752,8 @@ class MainWindow(QMainWindow):
             self.camera.stop()
             self.camera.wait(3000)
         self.reader.wait(3000)
+        if self._export_worker is not None:
+            self._export_worker.wait(3000)
         event.accept()
 
 
@@ -10,12 +10,15 @@ can demo and develop the full pipeline without the device.
 """
 
 import logging
-import random
-import time
+from typing import Optional
 
-from PyQt6.QtCore import QThread, pyqtSignal
+import numpy as np
+from PyQt6.QtCore import (
+    QThread, pyqtSignal, QMutex, QMutexLocker, QWaitCondition,
+)
 
 from src.models.shot import ClubData
+from src.utils.jit import njit
 
 logger = logging.getLogger(__name__)
 
@@ -90,6 +93,38 @@ TYPICAL_SPEEDS = {
 }
 
 
+# Clamp limits for generated (speed, face, path, contact, tempo)
+SWING_MIN = np.array([30.0, -15.0, -15.0, -2.0, 2.0])
+SWING_MAX = np.array([140.0, 15.0, 15.0, 2.0, 4.5])
+
+# Club speed std dev (mph) around the club's typical speed
+SPEED_STD = 3.0
+
+# Swings' worth of standard-normal draws generated per refill
+RAND_POOL_SIZE = 4096
+
+
+@njit(cache=True)
+def _sample_swings(noise, mean, std, base_speed, lo, hi):
+    """Scale rows of N(0, 1) noise to swing metrics and clamp them.
+
+    Args:
+        noise: (n, 5) standard-normal draws, one row per swing.
+
+    Returns:
+        New (n, 5) array of (speed, face_angle, path, contact, tempo).
+    """
+    n = noise.shape[0]
+    out = np.empty((n, 5))
+    for j in range(n):
+        for i in range(5):
+            v = mean[i] + std[i] * noise[j, i]
+            if i == 0:
+                v += base_speed
+            out[j, i] = min(max(v, lo[i]), hi[i])
+    return out
+
+
 class MockOptiShotReader(QThread):
     """Simulates OptiShot 2 swing data for development without hardware.
 
@@ -116,6 +151,7 @@ class MockOptiShotReader(QThread):
         club_type: str = "7-Iron",
         preset: str = "consistent_player",
         swing_interval: tuple[float, float] = (3.0, 8.0),
+        seed: Optional[int] = None,
         parent=None,
     ):
         """
@@ -123,6 +159,7 @@ class MockOptiShotReader(QThread):
             club_type: Initial club selection.
             preset: Player preset name (see PRESETS).
             swing_interval: (min, max) seconds between simulated swings.
+            seed: Optional seed for reproducible swings and intervals.
         """
         super().__init__(parent)
         self._running = False
@@ -132,6 +169,18 @@ class MockOptiShotReader(QThread):
         self._swing_interval = swing_interval
         self._swing_count = 0
 
+        # stop() wakes the inter-swing wait immediately
+        self._stop_mutex = QMutex()
+        self._stop_cond = QWaitCondition()
+
+        # All randomness (swings and intervals) comes from one Generator.
+        # Swings draw one row of pre-generated N(0, 1) noise each, scaled
+        # by the preset's (mean, std) columns
+        self._rng = np.random.default_rng(seed)
+        self._rand_pool = self._rng.standard_normal((RAND_POOL_SIZE, 5))
+        self._rand_idx = 0
+        self._set_preset_stats()
+
     def set_club(self, club_type: str):
         """Change the currently selected club."""
         self._club_type = club_type
@@ -141,8 +190,24 @@ class MockOptiShotReader(QThread):
         if preset in PRESETS:
             self._preset_name = preset
             self._preset = PRESETS[preset]
+            self._set_preset_stats()
             logger.info(f"Mock preset changed to: {preset}")
 
+    def _set_preset_stats(self):
+        """Cache the preset's (mean, std) per metric as arrays.
+
+        The speed mean holds only the preset offset; the club's typical
+        speed is added per swing.
+        """
+        p = self._preset
+        metrics = ("face_angle", "path", "contact", "tempo")
+        self._preset_mean = np.array(
+            [p["speed_offset"]] + [p[m][0] for m in metrics], dtype=float
+        )
+        self._preset_std = np.array(
+            [SPEED_STD] + [p[m][1] for m in metrics], dtype=float
+        )
+
     def run(self):
         """Main thread loop: generate swings at random intervals."""
         self._running = True
@@ -154,12 +219,11 @@ class MockOptiShotReader(QThread):
 
         while self._running:
             # Random delay between swings
-            delay = random.uniform(*self._swing_interval)
-            # Sleep in small increments so we can stop quickly
-            elapsed = 0.0
-            while elapsed < delay and self._running:
-                time.sleep(0.1)
-                elapsed += 0.1
+            delay = self._rng.uniform(*self._swing_interval)
+            # Wait out the delay without polling; stop() interrupts it
+            with QMutexLocker(self._stop_mutex):
+                if self._running:
+                    self._stop_cond.wait(self._stop_mutex, int(delay * 1000))
 
             if not self._running:
                 break
@@ -171,33 +235,24 @@ class MockOptiShotReader(QThread):
 
     def _generate_swing(self):
         """Generate a single simulated swing with realistic data."""
-        p = self._preset
         base_speed = TYPICAL_SPEEDS.get(self._club_type, 80)
 
-        # Club speed: base + preset offset + random variation
-        speed = base_speed + p["speed_offset"] + random.gauss(0, 3)
-        speed = max(30, min(140, speed))  # Clamp
-
-        # Face angle
-        face_mean, face_std = p["face_angle"]
-        face_angle = random.gauss(face_mean, face_std)
-        face_angle = max(-15, min(15, face_angle))
-
-        # Swing path
-        path_mean, path_std = p["path"]
-        path = random.gauss(path_mean, path_std)
-        path = max(-15, min(15, path))
-
-        # Contact point
-        contact_mean, contact_std = p["contact"]
-        contact = random.gauss(contact_mean, contact_std)
-        contact = max(-2, min(2, contact))
-
-        # Tempo
-        tempo_mean, tempo_std = p["tempo"]
-        tempo = random.gauss(tempo_mean, tempo_std)
-        tempo = max(2.0, min(4.5, tempo))
+        if self._rand_idx >= RAND_POOL_SIZE:
+            self._rand_pool = self._rng.standard_normal((RAND_POOL_SIZE, 5))
+            self._rand_idx = 0
+        noise = self._rand_pool[self._rand_idx:self._rand_idx + 1]
+        self._rand_idx += 1
+
+        # Club speed (base + preset offset), face angle, path, contact
+        # point and tempo: mean + std * N(0, 1), clamped
+        swing = _sample_swings(
+            noise, self._preset_mean, self._preset_std, float(base_speed),
+            SWING_MIN, SWING_MAX,
+        )
+        self._emit_swing(*swing[0].tolist())
 
+    def _emit_swing(self, speed, face_angle, path, contact, tempo):
+        """Round one swing's metrics into ClubData and emit it."""
         self._swing_count += 1
         club_data = ClubData(
             club_speed_mph=round(speed, 1),
@@ -220,9 +275,26 @@ class MockOptiShotReader(QThread):
         """Manually trigger a single swing (for UI button / testing)."""
         self._generate_swing()
 
+    def trigger_swings(self, n: int):
+        """Trigger n swings at once, sampling them in one batch.
+
+        Same sampling kernel as trigger_swing(), but the noise is drawn
+        as one (n, 5) block and scaled in one call before the swings are
+        emitted in order.
+        """
+        base_speed = TYPICAL_SPEEDS.get(self._club_type, 80)
+        swings = _sample_swings(
+            self._rng.standard_normal((n, 5)), self._preset_mean,
+            self._preset_std, float(base_speed), SWING_MIN, SWING_MAX,
+        )
+        for swing in swings.tolist():
+            self._emit_swing(*swing)
+
     def stop(self):
         """Signal the thread to stop."""
-        self._running = False
+        with QMutexLocker(self._stop_mutex):
+            self._running = False
+            self._stop_cond.wakeAll()
 
     def is_connected(self) -> bool:
         """Mock is always 'connected'."""
@@ -7,7 +7,7 @@ and typical spin rates used in ball flight calculations.
 
 from dataclasses import dataclass
 from enum import Enum
-from src.utils.constants import CLUB_LOFTS, SMASH_FACTORS, TYPICAL_BACKSPIN
+from src.utils.constants import CLUB_SPECS
 
 
 class ClubType(str, Enum):
@@ -49,12 +49,12 @@ class Club:
         """Create a Club from its type, looking up standard properties."""
         if isinstance(club_type, str):
             club_type = ClubType(club_type)
-        name = club_type.value
+        spec = CLUB_SPECS[club_type.value]
         return cls(
             club_type=club_type,
-            loft_deg=CLUB_LOFTS[name],
-            smash_factor=SMASH_FACTORS[name],
-            typical_backspin_rpm=TYPICAL_BACKSPIN[name],
+            loft_deg=spec.loft,
+            smash_factor=spec.smash,
+            typical_backspin_rpm=spec.backspin,
         )
 
     @property
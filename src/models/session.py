@@ -5,15 +5,42 @@ A session represents one practice period — from when the user starts
 hitting balls to when they stop. Contains multiple shots.
 """
 
+import math
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
-from statistics import mean, stdev
 
 from src.models.shot import Shot
 
 
-@dataclass
+class _RunningStats:
+    """Welford running mean / sample variance for one metric.
+
+    Each push is O(1) and numerically stable, so session stats never
+    need to rescan the shot list.
+    """
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def push(self, x: float):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+
+    def std(self) -> float:
+        """Sample standard deviation (0.0 with fewer than two values)."""
+        if self.count < 2:
+            return 0.0
+        return math.sqrt(self.m2 / (self.count - 1))
+
+
+@dataclass(slots=True)
 class Session:
     """A practice session containing multiple shots.
 
@@ -30,14 +57,61 @@ class Session:
     shots: list[Shot] = field(default_factory=list)
     notes: str = ""
 
+    # Monotonic clock readings for duration_minutes (ns); the start is
+    # anchored to start_time so sessions created with an explicit start
+    # still measure from it
+    _start_ns: int = field(default=0, init=False, repr=False, compare=False)
+    _end_ns: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # Running accumulators for get_stats, updated as shots are added
+    _speed: _RunningStats = field(
+        default_factory=_RunningStats, init=False, repr=False, compare=False
+    )
+    _carry: _RunningStats = field(
+        default_factory=_RunningStats, init=False, repr=False, compare=False
+    )
+    _face: _RunningStats = field(
+        default_factory=_RunningStats, init=False, repr=False, compare=False
+    )
+    _path: _RunningStats = field(
+        default_factory=_RunningStats, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        age = datetime.now() - self.start_time
+        self._start_ns = time.monotonic_ns() - int(age.total_seconds() * 1e9)
+        self._rebuild_stats()
+
     def add_shot(self, shot: Shot):
         """Add a shot to this session."""
         shot.session_id = self.id
         self.shots.append(shot)
+        self._push_stats(shot)
+
+    def _push_stats(self, shot: Shot):
+        """Fold a shot into the running stats (O(1))."""
+        club = shot.club_data
+        self._speed.push(club.club_speed_mph)
+        self._face.push(club.face_angle_deg)
+        self._path.push(club.path_deg)
+        if shot.carry_yards > 0:
+            self._carry.push(shot.carry_yards)
+
+    def _rebuild_stats(self):
+        """Recompute the running stats from self.shots."""
+        self._speed = _RunningStats()
+        self._carry = _RunningStats()
+        self._face = _RunningStats()
+        self._path = _RunningStats()
+        for shot in self.shots:
+            self._push_stats(shot)
 
     def end(self):
         """Mark the session as ended."""
         self.end_time = datetime.now()
+        self._end_ns = time.monotonic_ns()
 
     @property
     def num_shots(self) -> int:
@@ -45,34 +119,40 @@ class Session:
 
     @property
     def duration_minutes(self) -> float:
-        """Duration of the session in minutes."""
-        end = self.end_time or datetime.now()
-        return (end - self.start_time).total_seconds() / 60
+        """Duration of the session in minutes.
+
+        Uses the monotonic clock rather than datetime.now(), so polling
+        this while a session runs allocates nothing.
+        """
+        if self.end_time is not None and self._end_ns is None:
+            # Ended elsewhere (e.g. loaded from the database)
+            return (self.end_time - self.start_time).total_seconds() / 60
+        end_ns = self._end_ns or time.monotonic_ns()
+        return (end_ns - self._start_ns) / 6e10
 
     def get_stats(self) -> dict:
         """Compute aggregate statistics for the session."""
-        if not self.shots:
+        n = self._speed.count
+        if n != len(self.shots):
+            self._rebuild_stats()  # self.shots was modified directly
+            n = self._speed.count
+        if not n:
             return {}
 
-        speeds = [s.club_data.club_speed_mph for s in self.shots]
-        carries = [s.carry_yards for s in self.shots if s.carry_yards > 0]
-        faces = [s.club_data.face_angle_deg for s in self.shots]
-        paths = [s.club_data.path_deg for s in self.shots]
-
+        n_carries = self._carry.count
         stats = {
-            "num_shots": len(self.shots),
+            "num_shots": n,
             "duration_minutes": round(self.duration_minutes, 1),
-            "avg_club_speed": round(mean(speeds), 1),
-            "avg_carry": round(mean(carries), 1) if carries else 0,
-            "avg_face_angle": round(mean(faces), 1),
-            "avg_path": round(mean(paths), 1),
+            "avg_club_speed": round(self._speed.mean, 1),
+            "avg_carry": round(self._carry.mean, 1) if n_carries else 0,
+            "avg_face_angle": round(self._face.mean, 1),
+            "avg_path": round(self._path.mean, 1),
         }
 
-        if len(speeds) > 1:
-            stats["std_club_speed"] = round(stdev(speeds), 1)
-        if len(carries) > 1:
-            stats["std_carry"] = round(stdev(carries), 1)
-        if len(faces) > 1:
-            stats["std_face_angle"] = round(stdev(faces), 1)
+        if n > 1:
+            stats["std_club_speed"] = round(self._speed.std(), 1)
+            stats["std_face_angle"] = round(self._face.std(), 1)
+        if n_carries > 1:
+            stats["std_carry"] = round(self._carry.std(), 1)
 
         return stats
@@ -11,8 +11,15 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 
-@dataclass
+# Shot shape thresholds (degrees): spin axis / HLA within +-STRAIGHT is
+# straight / on line; spin axis beyond +-SEVERE is a slice / hook
+SHAPE_STRAIGHT_DEG = 2
+SHAPE_SEVERE_DEG = 8
+
+
+@dataclass(slots=True)
 class ClubData:
     """Raw club data as measured by the OptiShot 2 sensors.
 
@@ -33,7 +40,7 @@ class ClubData:
     tempo: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BallLaunch:
     """Estimated ball launch conditions derived from club data.
 
@@ -54,12 +61,12 @@ class BallLaunch:
     spin_axis_deg: float
 
 
-@dataclass
+@dataclass(slots=True)
 class TrajectoryResult:
     """Complete ball flight trajectory output.
 
     Attributes:
-        points: List of (x, y, z) positions in yards.
+        points: (N, 3) float32 array of (x, y, z) positions in yards.
                 x = lateral (positive = right), y = altitude, z = downrange.
         carry_yards: Carry distance (where ball lands).
         total_yards: Total distance including roll (estimated).
@@ -68,7 +75,7 @@ class TrajectoryResult:
                        (positive = right).
         flight_time_s: Total flight time in seconds.
     """
-    points: list[tuple[float, float, float]]
+    points: np.ndarray
     carry_yards: float
     total_yards: float
     apex_yards: float
@@ -76,7 +83,7 @@ class TrajectoryResult:
     flight_time_s: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Shot:
     """Complete shot record combining sensor data, launch, and trajectory.
 
@@ -118,15 +125,15 @@ class Shot:
         spin_axis = self.ball_launch.spin_axis_deg
 
         # Determine curvature from spin axis
-        if abs(spin_axis) < 2:
+        if abs(spin_axis) < SHAPE_STRAIGHT_DEG:
             curve = "Straight"
         elif spin_axis > 0:
-            curve = "Fade" if spin_axis < 8 else "Slice"
+            curve = "Fade" if spin_axis < SHAPE_SEVERE_DEG else "Slice"
         else:
-            curve = "Draw" if spin_axis > -8 else "Hook"
+            curve = "Draw" if spin_axis > -SHAPE_SEVERE_DEG else "Hook"
 
         # Determine start direction from HLA
-        if abs(hla) < 2:
+        if abs(hla) < SHAPE_STRAIGHT_DEG:
             start = "center"
         elif hla > 0:
             start = "right"
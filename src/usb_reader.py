@@ -27,8 +27,10 @@ Usage:
     reader.start()
 """
 
+from array import array
 import logging
 import math
+import struct
 import time
 
 from PyQt6.QtCore import QThread, pyqtSignal
@@ -39,6 +41,8 @@ from src.utils.constants import (
     OPTISHOT_PID,
     HID_PACKET_SIZE,
     HID_SUBPACKET_SIZE,
+    HID_READ_TIMEOUT_MS,
+    HID_FLUSH_TIMEOUT_MS,
     SIGNATURE_BACK_SENSOR,
     SIGNATURE_FRONT_SENSOR,
     SIGNATURE_CONTINUED,
@@ -57,6 +61,49 @@ logger = logging.getLogger(__name__)
 # Number of sensors per row in the USB protocol (8-bit bitmask each)
 SENSORS_PER_ROW = 8
 
+# One 5-byte sub-packet: front bitmask, back bitmask, signature, timing
+# (big-endian 16-bit)
+_SUBPACKET = struct.Struct(">BBBH")
+
+# Sensor bitmask byte -> indices of its set bits, lowest first (so [0] and
+# [-1] are the row's min/max sensor)
+_SENSOR_BITS = tuple(
+    tuple(j for j in range(SENSORS_PER_ROW) if (b >> j) & 0x01)
+    for b in range(256)
+)
+
+# Club speed (mph) = _SPEED_K / elapsed ticks: the row spacing over the
+# elapsed time (ticks * 18), converted to mph
+_SPEED_K = SENSOR_SPACING * SPEED_CONVERSION_FACTOR / 18
+
+# Face/path angle scale factors (sensor rows are SENSOR_SPACING apart)
+_INV_SENSOR_SPACING = 1.0 / SENSOR_SPACING
+_PATH_SCALE = math.degrees(LED_SPACING * _INV_SENSOR_SPACING)
+
+_SWING_COOLDOWN_NS = SWING_COOLDOWN_MS * 1_000_000
+
+
+def _report_view(data, length: int) -> memoryview:
+    """Zero-copy view of the first `length` bytes of a report.
+
+    Bytes-like reports (the poll loop passes bytes) are sliced in place;
+    lists of ints, as hidapi returns them, are converted first.
+    """
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data[:length])
+    return memoryview(data)[:length]
+
+
+def _sensor_range(activations) -> tuple[int, int]:
+    """(min, max) sensor index in a row's activations.
+
+    Computed once per swing instead of tracked per sub-packet; an empty
+    row gives (SENSORS_PER_ROW, -1).
+    """
+    if not activations:
+        return SENSORS_PER_ROW, -1
+    return min(activations), max(activations)
+
 
 class OptiShotReader(QThread):
     """Reads swing data from OptiShot 2 over USB HID.
@@ -86,9 +133,14 @@ class OptiShotReader(QThread):
         self._device = None
         self._hid_module = None
 
-        # Packet deduplication (RepliShot compares prev vs current)
+        # Packet deduplication (RepliShot compares prev vs current);
+        # holds the previous packet as bytes
         self._prev_data = None
 
+        # Output report buffer, reused for every command: byte 0 is the
+        # hidapi report ID (0x00 for default), byte 1 the command
+        self._cmd_buf = bytearray(HID_PACKET_SIZE + 1)
+
         # Swing state
         self._collect_swing = True
         self._reset_swing_state()
@@ -103,13 +155,8 @@ class OptiShotReader(QThread):
         self._front_triggered = False
 
         # Per-row sensor tracking (8 sensors each, indexed 0-7)
-        self._front_activations = []  # list of (sensor_index, timing)
-        self._back_activations = []
-
-        self._min_front = SENSORS_PER_ROW
-        self._max_front = -1
-        self._min_back = SENSORS_PER_ROW
-        self._max_back = -1
+        self._front_activations = array("B")  # sensor index per activation
+        self._back_activations = array("B")
 
         # Timing
         self._elapsed_time = 0
@@ -119,9 +166,9 @@ class OptiShotReader(QThread):
         # Ball detection
         self._potential_ball_read = False
         self._ball_timing_subtract = 0
-
-        # Sub-packet data for face angle computation
-        self._subpacket_history = []  # list of (sig, front_byte, back_byte, timing)
+        # Timing of the latest sub-packet (None before the first); ball
+        # detection only ever looks one sub-packet back
+        self._last_timing = None
 
     def run(self):
         """Main thread loop: open device, poll for data, detect swings."""
@@ -141,7 +188,7 @@ class OptiShotReader(QThread):
             try:
                 self._device = hid.device()
                 self._device.open(OPTISHOT_VID, OPTISHOT_PID)
-                self._device.set_nonblocking(True)
+                self._device.set_nonblocking(False)
                 logger.info(
                     f"OptiShot 2 connected "
                     f"(VID=0x{OPTISHOT_VID:04X}, PID=0x{OPTISHOT_PID:04X})"
@@ -192,24 +239,31 @@ class OptiShotReader(QThread):
         packet_count = 0
         while self._running and self._device:
             try:
-                data = self._device.read(HID_PACKET_SIZE)
+                # Blocks until a report arrives or the timeout passes
+                data = self._device.read(HID_PACKET_SIZE, HID_READ_TIMEOUT_MS)
                 if data:
                     packet_count += 1
-                    self.raw_data.emit(bytes(data))
+                    packet = bytes(data)
+                    # Raw packets are for debugging; skip the signal
+                    # dispatch (and hex logging) when nobody is listening
+                    if self.receivers(self.raw_data) > 0:
+                        self.raw_data.emit(packet)
 
                     # Log first few packets and then periodically for debugging
-                    if packet_count <= 5 or packet_count % 500 == 0:
-                        self._log_raw_packet(data, packet_count)
-
-                    # Packet deduplication: only process if different from previous
-                    if self._prev_data is not None and list(data) == self._prev_data:
+                    if (
+                        (packet_count <= 5 or packet_count % 500 == 0)
+                        and logger.isEnabledFor(logging.DEBUG)
+                    ):
+                        self._log_raw_packet(packet, packet_count)
+
+                    # Packet deduplication: only process if different from
+                    # previous (bytes equality is a single memcmp)
+                    if packet == self._prev_data:
                         continue
-                    self._prev_data = list(data)
+                    self._prev_data = packet
 
                     if self._collect_swing:
-                        self._process_packet(data)
-                else:
-                    time.sleep(0.001)  # 1ms sleep to avoid busy-wait
+                        self._process_packet(packet)
             except OSError:
                 logger.warning("Device read error — connection lost")
                 self.device_disconnected.emit()
@@ -217,26 +271,27 @@ class OptiShotReader(QThread):
 
     def _log_raw_packet(self, data, packet_num):
         """Log a raw packet in hex for debugging."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         hex_str = ' '.join(f'{b:02X}' for b in data[:60])
         logger.debug(f"Packet #{packet_num} ({len(data)} bytes): {hex_str}")
 
-        # Also decode sub-packets for readability
-        for i in range(0, min(len(data), HID_PACKET_SIZE), HID_SUBPACKET_SIZE):
-            front_byte = data[i]
-            back_byte = data[i + 1]
-            sig = data[i + 2]
-            timing = (data[i + 3] * 256) + data[i + 4]
+        # Also decode (whole) sub-packets for readability
+        n = min(len(data), HID_PACKET_SIZE)
+        n -= n % HID_SUBPACKET_SIZE
+        subpackets = _SUBPACKET.iter_unpack(_report_view(data, n))
+        for i, (front_byte, back_byte, sig, timing) in enumerate(subpackets):
             sig_name = {0x81: "ORIGIN", 0x4A: "FRONT", 0x52: "BACK+"}.get(
                 sig, f"0x{sig:02X}"
             )
             front_bits = f'{front_byte:08b}'
             back_bits = f'{back_byte:08b}'
             logger.debug(
-                f"  sub[{i//5:2d}]: front={front_bits} back={back_bits} "
+                f"  sub[{i:2d}]: front={front_bits} back={back_bits} "
                 f"sig={sig_name:6s} timing={timing:5d}"
             )
 
-    def _process_packet(self, data):
+    def _process_packet(self, data: bytes):
         """Process a 60-byte HID packet per RepliShot protocol.
 
         Each packet contains 12 x 5-byte sub-packets:
@@ -252,15 +307,22 @@ class OptiShotReader(QThread):
         if len(data) < HID_PACKET_SIZE:
             return
 
-        for i in range(0, HID_PACKET_SIZE, HID_SUBPACKET_SIZE):
-            front_byte = data[i]      # Front sensor bitmask
-            back_byte = data[i + 1]   # Back sensor bitmask
-            signature = data[i + 2]
-            timing = (data[i + 3] * 256) + data[i + 4]
-
-            self._subpacket_history.append(
-                (signature, front_byte, back_byte, timing)
-            )
+        # Hoist per-sub-packet lookups out of the loop; elapsed time is
+        # accumulated locally and written back after it. Sensor bytes are
+        # parsed inline: each bitmask's set-bit indices (_SENSOR_BITS)
+        # extend that row's activations. Debug logging in this path uses
+        # %-style args so nothing is formatted unless DEBUG is enabled.
+        last_timing = self._last_timing
+        add_front = self._front_activations.extend
+        add_back = self._back_activations.extend
+        elapsed = self._elapsed_time
+
+        subpackets = _SUBPACKET.iter_unpack(
+            _report_view(data, HID_PACKET_SIZE)
+        )
+        for front_byte, back_byte, signature, timing in subpackets:
+            prev_timing = last_timing
+            last_timing = timing
 
             if signature == SIGNATURE_BACK_SENSOR:  # 0x81 = Origin
                 # Origin sub-packet. If front_byte (data[i]) == 0,
@@ -268,61 +330,61 @@ class OptiShotReader(QThread):
                 if front_byte == 0:
                     self._back_orig = True
                     logger.debug(
-                        f"ORIGIN (back): back_byte=0x{back_byte:02X} "
-                        f"timing={timing}"
+                        "ORIGIN (back): back_byte=0x%02X timing=%d",
+                        back_byte, timing,
                     )
                 else:
                     # Front sensors triggered in origin packet
                     logger.debug(
-                        f"ORIGIN (front): front_byte=0x{front_byte:02X} "
-                        f"timing={timing}"
+                        "ORIGIN (front): front_byte=0x%02X timing=%d",
+                        front_byte, timing,
                     )
 
                 # Parse sensor bits from this sub-packet
-                self._parse_front_sensors(front_byte, timing)
-                self._parse_back_sensors(back_byte, timing)
-                self._elapsed_time += timing
+                add_front(_SENSOR_BITS[front_byte])
+                add_back(_SENSOR_BITS[back_byte])
+                elapsed += timing
 
             elif signature == SIGNATURE_CONTINUED:  # 0x52 = Additional back
                 # Additional back sensor reading
                 if front_byte != 0:
                     logger.debug(
-                        f"BACK+: unexpected front_byte=0x{front_byte:02X}"
+                        "BACK+: unexpected front_byte=0x%02X", front_byte
                     )
-                self._parse_back_sensors(back_byte, timing)
-                self._elapsed_time += timing
+                add_back(_SENSOR_BITS[back_byte])
+                elapsed += timing
 
             elif signature == SIGNATURE_FRONT_SENSOR:  # 0x4A = Front sensor
                 self._front_triggered = True
                 if back_byte != 0:
                     logger.debug(
-                        f"FRONT: unexpected back_byte=0x{back_byte:02X}"
+                        "FRONT: unexpected back_byte=0x%02X", back_byte
                     )
-                self._parse_front_sensors(front_byte, timing)
-                self._elapsed_time += timing
+                add_front(_SENSOR_BITS[front_byte])
+                elapsed += timing
 
                 # Speed is calculated at the FIRST front sensor crossing
                 if not self._first_front:
                     self._first_front = True
-                    self._speed_elapsed = self._elapsed_time
-                    logger.debug(
-                        f"First front crossing: elapsed={self._speed_elapsed}"
-                    )
+                    self._speed_elapsed = elapsed
+                    logger.debug("First front crossing: elapsed=%d", elapsed)
 
                 # Ball detection: large timing gap followed by small one
                 if timing > 0x25:
                     self._potential_ball_read = True
                 elif self._potential_ball_read and timing < 0x20:
                     # Ball confirmed — subtract the ball gap from speed calc
-                    prev_idx = len(self._subpacket_history) - 2
-                    if prev_idx >= 0:
-                        ball_timing = self._subpacket_history[prev_idx][3]
-                        self._ball_timing_subtract = ball_timing
+                    if prev_timing is not None:
+                        self._ball_timing_subtract = prev_timing
                         logger.debug(
-                            f"Ball detected: subtracting {ball_timing} from speed"
+                            "Ball detected: subtracting %d from speed",
+                            prev_timing,
                         )
                     self._potential_ball_read = False
 
+        self._elapsed_time = elapsed
+        self._last_timing = last_timing
+
         # Check for complete swing: back_orig AND front_triggered
         if self._back_orig and self._front_triggered:
             logger.info(
@@ -350,31 +412,11 @@ class OptiShotReader(QThread):
             )
             if has_any_data:
                 logger.debug(
-                    f"Partial: back_orig={self._back_orig}, "
-                    f"front={self._front_triggered}, "
-                    f"elapsed={self._elapsed_time}"
+                    "Partial: back_orig=%s, front=%s, elapsed=%d",
+                    self._back_orig, self._front_triggered,
+                    self._elapsed_time,
                 )
 
-    def _parse_front_sensors(self, byte_val, timing):
-        """Parse front sensor bitmask (8 sensors)."""
-        if byte_val == 0:
-            return
-        for j in range(8):
-            if (byte_val >> j) & 0x01:
-                self._front_activations.append((j, timing))
-                self._min_front = min(self._min_front, j)
-                self._max_front = max(self._max_front, j)
-
-    def _parse_back_sensors(self, byte_val, timing):
-        """Parse back sensor bitmask (8 sensors)."""
-        if byte_val == 0:
-            return
-        for j in range(8):
-            if (byte_val >> j) & 0x01:
-                self._back_activations.append((j, timing))
-                self._min_back = min(self._min_back, j)
-                self._max_back = max(self._max_back, j)
-
     def _compute_swing(self):
         """Compute club speed, face angle, and path from accumulated sensor data.
 
@@ -397,9 +439,7 @@ class OptiShotReader(QThread):
             return
 
         # --- Club head speed (mph) ---
-        speed_mph = (
-            SENSOR_SPACING / (speed_elapsed * 18)
-        ) * SPEED_CONVERSION_FACTOR
+        speed_mph = _SPEED_K / speed_elapsed
 
         logger.info(
             f"Speed calc: spacing={SENSOR_SPACING}, "
@@ -413,27 +453,26 @@ class OptiShotReader(QThread):
             return
 
         # --- Face angle (degrees) ---
-        x_travel_front = (self._max_front - self._min_front) * LED_SPACING
-        x_travel_back = (self._max_back - self._min_back) * LED_SPACING
+        min_front, max_front = _sensor_range(self._front_activations)
+        min_back, max_back = _sensor_range(self._back_activations)
+        x_travel_front = (max_front - min_front) * LED_SPACING
+        x_travel_back = (max_back - min_back) * LED_SPACING
 
         # Weight back sensors 2x (closer to ball contact per RepliShot)
         x_travel = (x_travel_front + 2 * x_travel_back) / 3
-        y_travel = SENSOR_SPACING
 
-        if y_travel > 0:
-            face_angle = math.atan2(x_travel, y_travel) * 180 / math.pi
-        else:
-            face_angle = 0.0
+        # atan(x / y) with y = SENSOR_SPACING (> 0), same as atan2(x, y)
+        face_angle = math.degrees(math.atan(x_travel * _INV_SENSOR_SPACING))
 
         # Determine sign from average sensor position
         center = SENSORS_PER_ROW / 2  # 4.0
         avg_front = (
-            sum(s[0] for s in self._front_activations) /
+            sum(self._front_activations) /
             len(self._front_activations)
             if self._front_activations else center
         )
         avg_back = (
-            sum(s[0] for s in self._back_activations) /
+            sum(self._back_activations) /
             len(self._back_activations)
             if self._back_activations else center
         )
@@ -442,12 +481,9 @@ class OptiShotReader(QThread):
 
         # --- Swing path (degrees) ---
         path_raw = 0.0
-        if self._max_front >= 0 and self._max_back >= 0:
-            path_raw = (
-                (self._max_front - self._max_back) +
-                (self._min_front - self._min_back)
-            )
-        path_deg = path_raw * (LED_SPACING / SENSOR_SPACING) * 180 / math.pi
+        if max_front >= 0 and max_back >= 0:
+            path_raw = (max_front - max_back) + (min_front - min_back)
+        path_deg = path_raw * _PATH_SCALE
         path_deg = max(-15, min(15, path_deg))  # Clamp
 
         # --- Contact point ---
@@ -458,8 +494,8 @@ class OptiShotReader(QThread):
             f"Swing detected: speed={speed_mph:.1f}mph, "
             f"face={face_angle:.1f} deg, path={path_deg:.1f} deg, "
             f"contact={contact_point:.1f}, "
-            f"front_range=[{self._min_front},{self._max_front}], "
-            f"back_range=[{self._min_back},{self._max_back}]"
+            f"front_range=[{min_front},{max_front}], "
+            f"back_range=[{min_back},{max_back}]"
         )
 
         club_data = ClubData(
@@ -480,20 +516,23 @@ class OptiShotReader(QThread):
         3. Flush any queued packets
         4. LED green (re-enable swing collection)
         """
-        # Sleep in small increments so we can stop quickly
-        cooldown_s = SWING_COOLDOWN_MS / 1000.0
-        sleep_step = 0.1
-        elapsed = 0.0
-        while elapsed < cooldown_s and self._running:
-            time.sleep(sleep_step)
-            elapsed += sleep_step
+        # Sleep in small increments so we can stop quickly; the deadline
+        # is on the monotonic clock, so oversleeping doesn't accumulate
+        deadline_ns = time.monotonic_ns() + _SWING_COOLDOWN_NS
+        while self._running:
+            remaining_ns = deadline_ns - time.monotonic_ns()
+            if remaining_ns <= 0:
+                break
+            time.sleep(min(0.1, remaining_ns / 1e9))
 
         # Flush buffered packets
         if self._device:
             flush_count = 0
             try:
                 while True:
-                    pkt = self._device.read(HID_PACKET_SIZE)
+                    pkt = self._device.read(
+                        HID_PACKET_SIZE, HID_FLUSH_TIMEOUT_MS
+                    )
                     if not pkt:
                         break
                     flush_count += 1
@@ -517,10 +556,8 @@ class OptiShotReader(QThread):
         """
         if self._device:
             try:
-                # Build a 60-byte report with command at byte 0
-                # Byte 0 for hidapi write() is the report ID (0x00 for default)
-                report = [0x00, command] + [0x00] * (HID_PACKET_SIZE - 1)
-                self._device.write(report)
+                self._cmd_buf[1] = command
+                self._device.write(self._cmd_buf)
                 logger.debug(f"Sent command 0x{command:02X}")
             except OSError as e:
                 logger.warning(f"Failed to send command 0x{command:02X}: {e}")
@@ -5,11 +5,17 @@ Handles settings storage, API key management, and device preferences.
 Settings are persisted to ~/.ironsight/config.json.
 """
 
+import atexit
 import json
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 
+# Delay before changed settings are written, so a burst of set() calls
+# costs a single write
+SAVE_DEBOUNCE_MS = 500
+
 
 class Config:
     """Manages application settings with JSON file persistence."""
@@ -25,6 +31,8 @@ class Config:
         "camera_resolution": [1280, 720],
         "clip_pre_seconds": 2.0,    # seconds before impact in clip
         "clip_post_seconds": 2.0,   # seconds after impact in clip
+        "camera_ring_scale": 2,     # store buffered/clip frames at 1/N size
+        "camera_ring_fps_divisor": 1,  # keep every Nth frame (1 = all)
         "device_mode": "auto",      # "auto", "usb", "mock"
         "mock_preset": "consistent_player",
         "anthropic_api_key": "",
@@ -37,45 +45,83 @@ class Config:
     }
 
     _instance: Optional["Config"] = None
-    _settings: dict
+    _settings: Optional[dict] = None  # loaded on first get()/set()
+    _dirs_ensured = False   # app and clips directories exist
+    _dirty = False          # settings changed since the last save
+    _save_scheduled = False
 
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._settings = {}
-            cls._instance._load()
+            atexit.register(cls._instance.flush)
         return cls._instance
 
+    def _ensure_dirs(self):
+        """Create the app and clips directories (once per process)."""
+        if not self._dirs_ensured:
+            self._CLIPS_DIR.mkdir(parents=True, exist_ok=True)
+            self._dirs_ensured = True
+
+    def _ensure_loaded(self) -> dict:
+        """Return the settings, loading them from disk on first use."""
+        if self._settings is None:
+            self._load()
+        return self._settings
+
     def _load(self):
         """Load settings from disk, merging with defaults."""
-        self._APP_DIR.mkdir(parents=True, exist_ok=True)
-        self._CLIPS_DIR.mkdir(parents=True, exist_ok=True)
-
-        if self._CONFIG_FILE.exists():
-            try:
-                with open(self._CONFIG_FILE) as f:
-                    saved = json.load(f)
-                # Merge: defaults first, then saved values override
-                self._settings = {**self._defaults, **saved}
-            except (json.JSONDecodeError, IOError):
-                self._settings = dict(self._defaults)
-        else:
+        self._ensure_dirs()
+
+        # One bulk read (no separate exists() stat); a missing file is
+        # just an OSError like any other unreadable one
+        try:
+            saved = json.loads(self._CONFIG_FILE.read_bytes())
+            # Merge: defaults first, then saved values override
+            self._settings = {**self._defaults, **saved}
+        except (json.JSONDecodeError, OSError):
             self._settings = dict(self._defaults)
 
     def save(self):
-        """Persist current settings to disk."""
-        self._APP_DIR.mkdir(parents=True, exist_ok=True)
-        with open(self._CONFIG_FILE, "w") as f:
-            json.dump(self._settings, f, indent=2)
+        """Persist current settings to disk.
+
+        Writes a temporary file and renames it over the config, so a
+        crash mid-write never leaves a truncated file.
+        """
+        self._ensure_dirs()
+        tmp = self._CONFIG_FILE.with_suffix(".json.tmp")
+        with open(tmp, "w") as f:
+            json.dump(self._ensure_loaded(), f, indent=2)
+        os.replace(tmp, self._CONFIG_FILE)
+        self._dirty = False
+
+    def flush(self):
+        """Save now if any setting changed since the last save."""
+        self._save_scheduled = False
+        if self._dirty:
+            self.save()
 
     def get(self, key: str, default=None):
         """Get a setting value."""
-        return self._settings.get(key, default)
+        return self._ensure_loaded().get(key, default)
 
     def set(self, key: str, value):
-        """Set a setting value and save."""
-        self._settings[key] = value
-        self.save()
+        """Set a setting value and save.
+
+        On the Qt main thread the write is debounced by SAVE_DEBOUNCE_MS
+        (and flushed at exit); elsewhere it is saved immediately.
+        """
+        self._ensure_loaded()[key] = value
+        self._dirty = True
+
+        # Qt is only consulted if the app already loaded it, so config (and
+        # the database, which imports it) stays usable without Qt
+        qtcore = sys.modules.get("PyQt6.QtCore")
+        app = qtcore.QCoreApplication.instance() if qtcore else None
+        if app is None or qtcore.QThread.currentThread() is not app.thread():
+            self.save()
+        elif not self._save_scheduled:
+            self._save_scheduled = True
+            qtcore.QTimer.singleShot(SAVE_DEBOUNCE_MS, self.flush)
 
     @classmethod
     def get_api_key(cls) -> str:
@@ -91,19 +137,19 @@ class Config:
     def get_clips_dir(cls) -> Path:
         """Get the directory for saving video clips."""
         instance = cls()
-        instance._CLIPS_DIR.mkdir(parents=True, exist_ok=True)
+        instance._ensure_dirs()
         return instance._CLIPS_DIR
 
     @classmethod
     def get_db_path(cls) -> Path:
         """Get the SQLite database file path."""
         instance = cls()
-        instance._APP_DIR.mkdir(parents=True, exist_ok=True)
+        instance._ensure_dirs()
         return instance._DB_PATH
 
     @classmethod
     def get_app_dir(cls) -> Path:
         """Get the application data directory."""
         instance = cls()
-        instance._APP_DIR.mkdir(parents=True, exist_ok=True)
+        instance._ensure_dirs()
         return instance._APP_DIR
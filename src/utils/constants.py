@@ -6,6 +6,8 @@ and verified against official specifications.
 """
 
 import math
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional
 
 # =============================================================================
 # OptiShot 2 USB Hardware Constants
@@ -30,6 +32,11 @@ HID_PACKET_SIZE = 60           # Bytes per USB HID report
 HID_SUBPACKET_SIZE = 5         # Each report contains 12 x 5-byte sub-packets
 SUBPACKETS_PER_REPORT = HID_PACKET_SIZE // HID_SUBPACKET_SIZE  # 12
 
+# Blocking HID reads: the reader thread sleeps in the kernel until a report
+# arrives or the timeout passes (so stop() is noticed within one timeout)
+HID_READ_TIMEOUT_MS = 10       # Poll loop read timeout
+HID_FLUSH_TIMEOUT_MS = 1       # Post-swing flush: stop once the queue is idle
+
 # Sub-packet signature bytes (byte index 2 within each 5-byte sub-packet)
 SIGNATURE_BACK_SENSOR = 0x81   # Back sensor row data
 SIGNATURE_FRONT_SENSOR = 0x4A  # Front sensor row data
@@ -73,117 +80,80 @@ RPM_TO_RAD_S = 2 * math.pi / 60  # RPM → rad/s
 # Spin tilt factor: converts face-to-path angle to spin axis tilt
 SPIN_TILT_FACTOR = 0.7
 
+# Putting: rolling deceleration on the green. A Stimpmeter releases the ball
+# at ~1.83 m/s; on a 10 ft (3.05 m) green it rolls to a stop, so
+# a = v² / (2d) ≈ 0.55 m/s².
+GREEN_ROLL_DECEL = 0.55        # m/s²
+
+# Degenerate full-swing inputs (sensor glitch / no real swing) below which
+# no flight is simulated. Putts are exempt: short putts are a few mph.
+MIN_SWING_SPEED_MPH = 5.0      # club and ball speed
+MIN_LAUNCH_ANGLE_DEG = 0.5     # vertical launch
+
 # =============================================================================
 # Club Data: Lofts, Smash Factors, Typical Spin Rates
 # =============================================================================
 
-# Standard club lofts in degrees
-CLUB_LOFTS = {
-    "Driver":    10.5,
-    "3-Wood":    15.0,
-    "5-Wood":    18.0,
-    "7-Wood":    21.0,
-    "2-Hybrid":  17.0,
-    "3-Hybrid":  19.0,
-    "4-Hybrid":  22.0,
-    "5-Hybrid":  25.0,
-    "2-Iron":    17.0,
-    "3-Iron":    20.0,
-    "4-Iron":    23.0,
-    "5-Iron":    26.0,
-    "6-Iron":    30.0,
-    "7-Iron":    34.0,
-    "8-Iron":    38.0,
-    "9-Iron":    42.0,
-    "PW":        46.0,
-    "GW":        50.0,
-    "SW":        54.0,
-    "LW":        58.0,
-    "Putter":    3.0,
-}
-
-# Smash factor: ball_speed / club_speed (how efficiently energy transfers)
-SMASH_FACTORS = {
-    "Driver":    1.48,
-    "3-Wood":    1.44,
-    "5-Wood":    1.42,
-    "7-Wood":    1.40,
-    "2-Hybrid":  1.40,
-    "3-Hybrid":  1.39,
-    "4-Hybrid":  1.38,
-    "5-Hybrid":  1.37,
-    "2-Iron":    1.38,
-    "3-Iron":    1.37,
-    "4-Iron":    1.36,
-    "5-Iron":    1.35,
-    "6-Iron":    1.34,
-    "7-Iron":    1.33,
-    "8-Iron":    1.32,
-    "9-Iron":    1.30,
-    "PW":        1.28,
-    "GW":        1.25,
-    "SW":        1.22,
-    "LW":        1.18,
-    "Putter":    1.00,
-}
-
-# Typical backspin rates (RPM) at standard club speed
-TYPICAL_BACKSPIN = {
-    "Driver":    2700,
-    "3-Wood":    3500,
-    "5-Wood":    4300,
-    "7-Wood":    4800,
-    "2-Hybrid":  3800,
-    "3-Hybrid":  4200,
-    "4-Hybrid":  4600,
-    "5-Hybrid":  5000,
-    "2-Iron":    3800,
-    "3-Iron":    4200,
-    "4-Iron":    4700,
-    "5-Iron":    5500,
-    "6-Iron":    6200,
-    "7-Iron":    7000,
-    "8-Iron":    7800,
-    "9-Iron":    8600,
-    "PW":        9300,
-    "GW":       10000,
-    "SW":       10500,
-    "LW":       11000,
-    "Putter":     300,
-}
-
-# PGA Tour average carry distances (yards) for validation
-PGA_AVERAGE_CARRY = {
-    "Driver":    275,
-    "3-Wood":    243,
-    "5-Wood":    230,
-    "3-Hybrid":  225,
-    "4-Iron":    210,
-    "5-Iron":    200,
-    "6-Iron":    188,
-    "7-Iron":    172,
-    "8-Iron":    160,
-    "9-Iron":    148,
-    "PW":        136,
-    "GW":        124,
-    "SW":        112,
-    "LW":         95,
-}
-
-# PGA Tour average club speeds (mph)
-PGA_AVERAGE_CLUB_SPEED = {
-    "Driver":    113,
-    "3-Wood":    107,
-    "5-Wood":    103,
-    "3-Hybrid":  100,
-    "4-Iron":     97,
-    "5-Iron":     94,
-    "6-Iron":     92,
-    "7-Iron":     90,
-    "8-Iron":     87,
-    "9-Iron":     85,
-    "PW":         83,
-    "GW":         80,
-    "SW":         78,
-    "LW":         74,
-}
+class ClubSpec(NamedTuple):
+    """Standard properties of one club (see CLUB_SPECS).
+
+    Attributes:
+        loft: Standard loft in degrees.
+        smash: Smash factor: ball_speed / club_speed (how efficiently
+               energy transfers).
+        backspin: Typical backspin (RPM) at standard club speed.
+        pga_carry: PGA Tour average carry (yards), for validation.
+        pga_speed: PGA Tour average club speed (mph).
+    """
+    loft: float
+    smash: float
+    backspin: int
+    pga_carry: Optional[int]
+    pga_speed: Optional[int]
+
+
+# Club name -> ClubSpec; one lookup gives every property of a club
+CLUB_SPECS: Mapping[str, ClubSpec] = MappingProxyType({
+    #                    loft smash   spin carry speed
+    "Driver":   ClubSpec(10.5, 1.48,  2700,  275,  113),
+    "3-Wood":   ClubSpec(15.0, 1.44,  3500,  243,  107),
+    "5-Wood":   ClubSpec(18.0, 1.42,  4300,  230,  103),
+    "7-Wood":   ClubSpec(21.0, 1.40,  4800, None, None),
+    "2-Hybrid": ClubSpec(17.0, 1.40,  3800, None, None),
+    "3-Hybrid": ClubSpec(19.0, 1.39,  4200,  225,  100),
+    "4-Hybrid": ClubSpec(22.0, 1.38,  4600, None, None),
+    "5-Hybrid": ClubSpec(25.0, 1.37,  5000, None, None),
+    "2-Iron":   ClubSpec(17.0, 1.38,  3800, None, None),
+    "3-Iron":   ClubSpec(20.0, 1.37,  4200, None, None),
+    "4-Iron":   ClubSpec(23.0, 1.36,  4700,  210,   97),
+    "5-Iron":   ClubSpec(26.0, 1.35,  5500,  200,   94),
+    "6-Iron":   ClubSpec(30.0, 1.34,  6200,  188,   92),
+    "7-Iron":   ClubSpec(34.0, 1.33,  7000,  172,   90),
+    "8-Iron":   ClubSpec(38.0, 1.32,  7800,  160,   87),
+    "9-Iron":   ClubSpec(42.0, 1.30,  8600,  148,   85),
+    "PW":       ClubSpec(46.0, 1.28,  9300,  136,   83),
+    "GW":       ClubSpec(50.0, 1.25, 10000,  124,   80),
+    "SW":       ClubSpec(54.0, 1.22, 10500,  112,   78),
+    "LW":       ClubSpec(58.0, 1.18, 11000,   95,   74),
+    "Putter":   ClubSpec( 3.0, 1.00,   300, None, None),
+})
+
+# Per-property views of CLUB_SPECS (clubs without PGA data are omitted
+# from the PGA tables)
+CLUB_LOFTS = MappingProxyType(
+    {name: spec.loft for name, spec in CLUB_SPECS.items()}
+)
+SMASH_FACTORS = MappingProxyType(
+    {name: spec.smash for name, spec in CLUB_SPECS.items()}
+)
+TYPICAL_BACKSPIN = MappingProxyType(
+    {name: spec.backspin for name, spec in CLUB_SPECS.items()}
+)
+PGA_AVERAGE_CARRY = MappingProxyType({
+    name: spec.pga_carry for name, spec in CLUB_SPECS.items()
+    if spec.pga_carry is not None
+})
+PGA_AVERAGE_CLUB_SPEED = MappingProxyType({
+    name: spec.pga_speed for name, spec in CLUB_SPECS.items()
+    if spec.pga_speed is not None
+})
@@ -0,0 +1,30 @@
+"""
+Optional Numba JIT support for IronSight.
+
+Numba compiles the numeric hot paths (trajectory integration, aerodynamic
+coefficients) to native code. It is an optional dependency: when it is not
+installed, `njit` degrades to a no-op decorator and the same functions run
+as plain Python.
+
+Usage:
+    from src.utils.jit import njit
+
+    @njit(cache=True, fastmath=True)
+    def kernel(x):
+        ...
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
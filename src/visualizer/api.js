@@ -1,12 +1,13 @@
 /**
  * IronSight Python-JS Bridge API
  *
- * These functions are called from Python via QWebEngineView's
+ * These functions are called from Python, either through the
+ * QWebChannel `bridge` object or via QWebEngineView's
  * page().runJavaScript(). They provide the interface between
  * the Python ball flight engine and the Three.js visualization.
  *
  * Usage from Python:
- *   self.web_view.page().runJavaScript(f"window.addShot({json})")
+ *   self._viz_bridge.shot_ready.emit(shot_dict)   # -> window.addShot
  *   self.web_view.page().runJavaScript("window.clearShots()")
  *   self.web_view.page().runJavaScript("window.resetCamera()")
  */
@@ -16,6 +17,14 @@ window.addShot = addShot;
 window.clearShots = clearShots;
 window.resetCamera = resetCamera;
 
+// Shots arrive over QWebChannel as native objects (not available when
+// the page is opened directly in a browser)
+if (typeof QWebChannel !== 'undefined' && window.qt && qt.webChannelTransport) {
+    new QWebChannel(qt.webChannelTransport, function(channel) {
+        channel.objects.bridge.shot_ready.connect(addShot);
+    });
+}
+
 // Also expose for testing/debugging in browser console
 window.debugShot = function() {
     // Generate a sample shot for testing the visualization
@@ -28,7 +37,7 @@ window.debugShot = function() {
         const z = carry * t;
         const y = apex * 4 * t * (1 - t);  // Parabolic arc
         const x = lateral * t * t;           // Curved lateral
-        points.push([x, y, z]);
+        points.push(x, y, z);  // flat, as sent from Python
     }
 
     window.addShot({
@@ -35,18 +35,26 @@ const TRAIL_COLORS = [
 // ============================================================
 
 /**
- * Render a trajectory arc from an array of (x, y, z) points.
- * Returns the Three.js Line object.
+ * Convert flat [x0, y0, z0, x1, ...] yard coordinates from Python into
+ * a Float32Array in Three.js space (z negated), in a single pass.
  */
-function renderTrajectoryArc(points, color, opacity) {
-    const vertices = [];
-    for (const [x, y, z] of points) {
-        vertices.push(x, y, -z);  // Negate z for Three.js
+function toScenePositions(points) {
+    const positions = new Float32Array(points);
+    for (let i = 2; i < positions.length; i += 3) {
+        positions[i] = -positions[i];
     }
+    return positions;
+}
 
+/**
+ * Render a trajectory arc from a flat Float32Array of scene positions.
+ * The array is used directly as the geometry's position buffer.
+ * Returns the Three.js Line object.
+ */
+function renderTrajectoryArc(positions, color, opacity) {
     const geometry = new THREE.BufferGeometry();
     geometry.setAttribute('position',
-        new THREE.Float32BufferAttribute(vertices, 3)
+        new THREE.BufferAttribute(positions, 3)
     );
 
     const material = new THREE.LineBasicMaterial({
@@ -84,11 +92,11 @@ function addLandingMarker(x, y, z, color) {
 
 /**
  * Animate a ball along a trajectory path.
- * @param {Array} points - Array of [x, y, z] positions (yards)
+ * @param {Float32Array} positions - Flat scene positions (yards, z negated)
  * @param {number} flightTime - Total flight time in seconds
  * @param {Function} onComplete - Called when animation finishes
  */
-function animateBall(points, flightTime, onComplete) {
+function animateBall(positions, flightTime, onComplete) {
     // Remove previous ball
     if (currentBall) {
         scene.remove(currentBall);
@@ -106,6 +114,7 @@ function animateBall(points, flightTime, onComplete) {
 
     // Animation state
     let elapsed = 0;
+    const count = positions.length / 3;
     const speed = Math.max(0.5, flightTime * 0.6); // Slightly faster than real-time
 
     window._activeBallAnimation = (dt) => {
@@ -113,20 +122,20 @@ function animateBall(points, flightTime, onComplete) {
         const t = Math.min(elapsed / speed, 1.0);
 
         // Interpolate position along trajectory
-        const idx = Math.min(
-            Math.floor(t * (points.length - 1)),
-            points.length - 2
-        );
-        const localT = (t * (points.length - 1)) - idx;
+        const idx = Math.max(0, Math.min(
+            Math.floor(t * (count - 1)),
+            count - 2
+        ));
+        const localT = Math.min((t * (count - 1)) - idx, 1.0);
 
-        const p0 = points[idx];
-        const p1 = points[idx + 1];
+        const i0 = idx * 3;
+        const i1 = Math.min(idx + 1, count - 1) * 3;
 
-        const x = p0[0] + (p1[0] - p0[0]) * localT;
-        const y = p0[1] + (p1[1] - p0[1]) * localT;
-        const z = p0[2] + (p1[2] - p0[2]) * localT;
+        const x = positions[i0] + (positions[i1] - positions[i0]) * localT;
+        const y = positions[i0 + 1] + (positions[i1 + 1] - positions[i0 + 1]) * localT;
+        const z = positions[i0 + 2] + (positions[i1 + 2] - positions[i0 + 2]) * localT;
 
-        currentBall.position.set(x, y, -z);
+        currentBall.position.set(x, y, z);
 
         if (t >= 1.0) {
             window._activeBallAnimation = null;
@@ -144,7 +153,7 @@ function animateBall(points, flightTime, onComplete) {
  * Called from Python via JS bridge.
  *
  * @param {Object} shotData - Shot data from Python:
- *   - points: Array of [x, y, z] trajectory points (yards)
+ *   - points: Flat [x0, y0, z0, x1, ...] trajectory points (yards)
  *   - carry: Carry distance (yards)
  *   - total: Total distance (yards)
  *   - apex: Max height (yards)
@@ -175,15 +184,16 @@ function addShot(shotData) {
     }
 
     // Render new trajectory arc
-    const arc = renderTrajectoryArc(shotData.points, color, 0.9);
+    const positions = toScenePositions(shotData.points);
+    const arc = renderTrajectoryArc(positions, color, 0.9);
     shotTrails.push(arc);
 
-    // Add landing marker
-    const lastPt = shotData.points[shotData.points.length - 1];
-    addLandingMarker(lastPt[0], lastPt[1], lastPt[2], color);
+    // Add landing marker (takes yard coordinates, so un-negate z)
+    const n = positions.length;
+    addLandingMarker(positions[n - 3], positions[n - 2], -positions[n - 1], color);
 
     // Animate ball along trajectory
-    animateBall(shotData.points, shotData.flightTime, () => {
+    animateBall(positions, shotData.flightTime, () => {
         // Ball has landed
     });
 
@@ -5,9 +5,12 @@ Uses mocked Anthropic client to avoid real API calls in CI.
 Tests frame extraction, data formatting, and response handling.
 """
 
+import asyncio
+from collections import OrderedDict
+
 import numpy as np
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.models.shot import ClubData, BallLaunch, Shot
 
@@ -19,6 +22,7 @@ class TestFrameExtraction:
         """Should encode a frame as a non-trivial base64 string."""
         from src.ai_coach import AISwingCoach
         coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
         frame = np.zeros((480, 640, 3), dtype=np.uint8)
         b64 = coach._frame_to_base64(frame)
         assert isinstance(b64, str)
@@ -28,6 +32,7 @@ class TestFrameExtraction:
         """Should return empty list for missing video file."""
         from src.ai_coach import AISwingCoach
         coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
         frames = coach._extract_key_frames("/nonexistent/video.mp4")
         assert frames == []
 
@@ -61,6 +66,7 @@ class TestAnalyzeSwing:
 
         from src.ai_coach import AISwingCoach
         coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
         coach.client = mock_client
         coach.db = None
 
@@ -76,6 +82,79 @@ class TestAnalyzeSwing:
         assert "7-Iron" in prompt
         assert "90.0" in prompt
 
+    def test_system_prompt_in_system_block(self):
+        """The coaching persona should be sent as a system block."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Tip.")]
+        mock_client.messages.create.return_value = mock_response
+
+        from src.ai_coach import AISwingCoach, COACH_SYSTEM_PROMPT
+        coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
+        coach.client = mock_client
+        coach.db = None
+
+        coach._analyze_data_only(self._make_shot())
+
+        call_args = mock_client.messages.create.call_args
+        system = call_args[1]["system"]
+        assert system[-1]["text"] == COACH_SYSTEM_PROMPT
+        # Too short for the prompt cache's minimum prefix, so no marker
+        assert "cache_control" not in system[-1]
+        prompt = call_args[1]["messages"][0]["content"]
+        assert "PGA-certified" not in prompt
+
+
+    def test_identical_request_served_from_cache(self):
+        """Re-analyzing the same shot should not call the API again."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.content = [MagicMock(text="Cached tip.")]
+        mock_response.usage.input_tokens = 100
+        mock_response.usage.output_tokens = 50
+        mock_client.messages.create.return_value = mock_response
+
+        from src.ai_coach import AISwingCoach
+        coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
+        coach.client = mock_client
+        coach.db = None
+
+        shot = self._make_shot()
+        assert coach._analyze_data_only(shot) == "Cached tip."
+        assert coach._analyze_data_only(shot) == "Cached tip."
+        mock_client.messages.create.assert_called_once()
+
+    def test_streamed_chunks_forwarded(self):
+        """With on_text, chunks should be forwarded as they stream in."""
+        mock_client = MagicMock()
+        final = MagicMock()
+        final.content = [MagicMock(text="Hold the finish.")]
+        final.usage.input_tokens = 100
+        final.usage.output_tokens = 5
+        stream = mock_client.messages.stream.return_value.__enter__.return_value
+        stream.text_stream = iter(["Hold ", "the ", "finish."])
+        stream.get_final_message.return_value = final
+
+        from src.ai_coach import AISwingCoach
+        coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
+        coach.client = mock_client
+        coach.db = None
+
+        chunks = []
+        shot = self._make_shot()
+        assert coach.analyze_swing(shot, on_text=chunks.append) == "Hold the finish."
+        assert chunks == ["Hold ", "the ", "finish."]
+        mock_client.messages.create.assert_not_called()
+
+        # Cache hit replays the full text in one chunk
+        chunks.clear()
+        coach.analyze_swing(shot, on_text=chunks.append)
+        assert chunks == ["Hold the finish."]
+        mock_client.messages.stream.assert_called_once()
+
 
 class TestAnalyzeSession:
     """Test session analysis with mocked API."""
@@ -99,6 +178,7 @@ class TestAnalyzeSession:
         """Should require at least 3 shots for session analysis."""
         from src.ai_coach import AISwingCoach
         coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
         coach.client = MagicMock()
         coach.db = None
 
@@ -118,6 +198,7 @@ class TestAnalyzeSession:
 
         from src.ai_coach import AISwingCoach
         coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
         coach.client = mock_client
         coach.db = None
 
@@ -141,7 +222,141 @@ class TestAnalyzeTrends:
         """Should require at least 2 sessions for trend analysis."""
         from src.ai_coach import AISwingCoach
         coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
         coach.client = MagicMock()
 
         result = coach.analyze_trends([{"avg_carry": 170}])
         assert "at least 2" in result.lower()
+
+
+class TestAnalyzeShotsBatch:
+    """Test batched per-shot analysis with mocked Batches API."""
+
+    def _make_result(self, custom_id, text):
+        entry = MagicMock()
+        entry.custom_id = custom_id
+        entry.result.type = "succeeded"
+        entry.result.message.content = [MagicMock(text=text)]
+        entry.result.message.usage.input_tokens = 100
+        entry.result.message.usage.output_tokens = 50
+        return entry
+
+    def test_batch_results_mapped_in_order(self):
+        """Results should be returned in input order regardless of arrival order."""
+        mock_client = MagicMock()
+        pending = MagicMock(id="batch_1", processing_status="in_progress")
+        ended = MagicMock(id="batch_1", processing_status="ended")
+        mock_client.messages.batches.create.return_value = pending
+        mock_client.messages.batches.retrieve.return_value = ended
+        mock_client.messages.batches.results.return_value = [
+            self._make_result("shot-1", "Second shot tip."),
+            self._make_result("shot-0", "First shot tip."),
+        ]
+
+        from src.ai_coach import AISwingCoach
+        coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
+        coach.client = mock_client
+        coach.db = None
+
+        shots = [
+            Shot(club_data=ClubData(90.0, 1.0, 0.5, 0, "7-Iron")),
+            Shot(club_data=ClubData(95.0, -1.0, 0.5, 0, "Driver")),
+        ]
+        with patch("src.ai_coach.time.sleep"):
+            result = coach.analyze_shots_batch(shots)
+
+        assert result == ["First shot tip.", "Second shot tip."]
+        requests = mock_client.messages.batches.create.call_args[1]["requests"]
+        assert [r["custom_id"] for r in requests] == ["shot-0", "shot-1"]
+        assert "Driver" in requests[1]["params"]["messages"][0]["content"]
+
+
+class TestAnalyzeMany:
+    """Test concurrent per-shot analysis with a mocked async client."""
+
+    def test_results_in_order_and_bulk_saved(self):
+        """analyze_many should return feedback per shot and save once."""
+        async def fake_create(**params):
+            prompt = params["messages"][0]["content"]
+            response = MagicMock()
+            response.content = [MagicMock(text=prompt.split(",")[0])]
+            response.usage.input_tokens = 10
+            response.usage.output_tokens = 5
+            return response
+
+        from src.ai_coach import AISwingCoach
+        coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
+        coach.async_client = MagicMock()
+        coach.async_client.messages.create = AsyncMock(side_effect=fake_create)
+        coach.db = MagicMock()
+        coach.db.get_cached_response.return_value = None
+
+        shots = [
+            Shot(club_data=ClubData(90.0, 1.0, 0.5, 0, "7-Iron"), id=1),
+            Shot(club_data=ClubData(95.0, -1.0, 0.5, 0, "Driver"), id=2),
+        ]
+        result = asyncio.run(coach.analyze_many(shots, max_concurrency=2))
+
+        assert "7-Iron" in result[0]
+        assert "Driver" in result[1]
+        assert coach.async_client.messages.create.await_count == 2
+        coach.db.save_ai_feedback_many.assert_called_once()
+        records = coach.db.save_ai_feedback_many.call_args[0][0]
+        assert [r["shot_id"] for r in records] == [1, 2]
+        assert all(r["tokens"] == 15 for r in records)
+        assert coach.db.save_cached_response.call_count == 2
+
+    def test_failure_keeps_other_results(self):
+        """One failed request should not discard the other shots."""
+        async def fake_create(**params):
+            prompt = params["messages"][0]["content"]
+            if "Driver" in prompt:
+                raise RuntimeError("API timeout")
+            response = MagicMock()
+            response.content = [MagicMock(text="Nice strike.")]
+            response.usage.input_tokens = 10
+            response.usage.output_tokens = 5
+            return response
+
+        from src.ai_coach import AISwingCoach
+        coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
+        coach.async_client = MagicMock()
+        coach.async_client.messages.create = AsyncMock(side_effect=fake_create)
+        coach.db = MagicMock()
+        coach.db.get_cached_response.return_value = None
+
+        shots = [
+            Shot(club_data=ClubData(90.0, 1.0, 0.5, 0, "7-Iron"), id=1),
+            Shot(club_data=ClubData(95.0, -1.0, 0.5, 0, "Driver"), id=2),
+        ]
+        result = asyncio.run(coach.analyze_many(shots))
+
+        assert result == ["Nice strike.", ""]
+        records = coach.db.save_ai_feedback_many.call_args[0][0]
+        assert [r["shot_id"] for r in records] == [1]
+
+    def test_repeat_request_served_from_cache(self):
+        """analyze_many should share the response cache with _complete."""
+        async def fake_create(**params):
+            response = MagicMock()
+            response.content = [MagicMock(text="Same tip.")]
+            response.usage.input_tokens = 10
+            response.usage.output_tokens = 5
+            return response
+
+        from src.ai_coach import AISwingCoach
+        coach = AISwingCoach.__new__(AISwingCoach)
+        coach._response_cache = OrderedDict()
+        coach.async_client = MagicMock()
+        coach.async_client.messages.create = AsyncMock(side_effect=fake_create)
+        coach.db = None
+
+        shot = Shot(club_data=ClubData(90.0, 1.0, 0.5, 0, "7-Iron"))
+        first = asyncio.run(coach.analyze_many([shot]))
+        second = asyncio.run(coach.analyze_many([shot]))
+
+        assert first == second == ["Same tip."]
+        assert coach.async_client.messages.create.await_count == 1
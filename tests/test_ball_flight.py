@@ -14,6 +14,7 @@ import pytest
 from src.models.shot import ClubData, BallLaunch
 from src.ball_flight import (
     club_to_ball_launch,
+    club_to_ball_launch_batch,
     compute_trajectory,
     compute_shot,
     _drag_coefficient,
@@ -97,6 +98,35 @@ class TestClubToBallLaunch:
         assert bl.vla_deg < 10
         assert bl.backspin_rpm < 1000
 
+    def test_cached_launch_not_shared(self):
+        """Repeated inputs should yield equal but independent BallLaunch objects."""
+        cd = ClubData(85.0, 1.0, -0.5, 0.0, "7-Iron")
+        first = club_to_ball_launch(cd)
+        second = club_to_ball_launch(cd)
+        assert first == second
+        assert first is not second
+
+    def test_batch_matches_scalar(self):
+        """Batch launch should match club_to_ball_launch swing by swing."""
+        swings = [
+            (100.0, 0.0, 0.0, "Driver"),
+            (85.0, 3.0, -2.0, "7-Iron"),
+            (70.0, -4.5, 1.5, "SW"),
+            (3.0, 0.0, 0.0, "7-Iron"),     # below minimum swing speed
+            (6.0, 1.0, 0.0, "Putter"),
+            (80.0, 2.0, 2.0, "Unknown"),   # falls back to default spec
+        ]
+        speeds, faces, paths, clubs = zip(*swings)
+        batch = club_to_ball_launch_batch(speeds, faces, paths, clubs)
+        # np.round may differ from round() by one step at near-ties
+        steps = (0.1, 0.1, 0.1, 1.0, 0.1)
+        for i, swing in enumerate(swings):
+            bl = club_to_ball_launch(ClubData(*swing[:3], 0.0, swing[3]))
+            expected = (bl.ball_speed_mph, bl.vla_deg, bl.hla_deg,
+                        bl.backspin_rpm, bl.spin_axis_deg)
+            for values, want, step in zip(batch, expected, steps):
+                assert float(values[i]) == pytest.approx(want, abs=step)
+
 
 class TestComputeTrajectory:
     """Tests for Stage 2: trajectory simulation."""
@@ -147,7 +177,7 @@ class TestComputeTrajectory:
         """Trajectory should start at (0, 0, 0)."""
         launch = self._make_launch()
         result = compute_trajectory(launch)
-        assert result.points[0] == (0.0, 0.0, 0.0)
+        assert result.points[0].tolist() == [0.0, 0.0, 0.0]
 
     def test_trajectory_ends_near_ground(self):
         """Ball should land near y=0."""
@@ -156,12 +186,51 @@ class TestComputeTrajectory:
         last_y = result.points[-1][1]
         assert last_y < 2.0  # Within 2 yards of ground
 
+    def test_landing_within_first_step(self):
+        """A flight shorter than one time step should still carry forward."""
+        launch = self._make_launch(ball_speed=10, vla=3, backspin=300)
+        result = compute_trajectory(launch)
+        assert result.flight_time_s > 0
+        assert result.carry_yards > 0
+        assert result.points[-1][1] == 0.0
+
+    def test_simplified_keeps_apex_and_landing(self):
+        """RDP thinning should drop points but keep apex and landing exact."""
+        full = compute_trajectory(self._make_launch())
+        thin = compute_trajectory(self._make_launch(), simplify_yards=0.25)
+        assert len(thin.points) < len(full.points)
+        assert thin.points[0].tolist() == full.points[0].tolist()
+        assert thin.points[-1].tolist() == full.points[-1].tolist()
+        assert thin.points[:, 1].max() == full.points[:, 1].max()
+        assert thin.carry_yards == full.carry_yards
+
+    def test_summary_only_matches_full(self):
+        """return_points=False should keep the stats and just the landing."""
+        full = compute_trajectory(self._make_launch(hla=2, spin_axis=10))
+        summary = compute_trajectory(
+            self._make_launch(hla=2, spin_axis=10), return_points=False
+        )
+        assert summary.points.tolist() == full.points[-1:].tolist()
+        assert (summary.carry_yards, summary.total_yards, summary.apex_yards,
+                summary.lateral_yards, summary.flight_time_s) == (
+            full.carry_yards, full.total_yards, full.apex_yards,
+            full.lateral_yards, full.flight_time_s)
+
     def test_zero_speed_no_crash(self):
         """Zero ball speed should not crash."""
         launch = self._make_launch(ball_speed=0)
         result = compute_trajectory(launch)
         assert result.carry_yards == 0 or len(result.points) > 0
 
+    def test_degenerate_launch_skips_flight(self):
+        """Sub-threshold speed or launch angle should return an empty flight."""
+        for launch in (self._make_launch(ball_speed=3),
+                       self._make_launch(vla=0.2)):
+            result = compute_trajectory(launch)
+            assert result.points.tolist() == [[0.0, 0.0, 0.0]]
+            assert result.carry_yards == 0
+            assert result.flight_time_s == 0
+
     def test_headwind_reduces_carry(self):
         """Headwind should reduce carry distance.
         Wind direction convention: direction wind comes FROM.
@@ -229,6 +298,19 @@ class TestComputeShot:
         assert trajectory.carry_yards > 0
         assert len(trajectory.points) > 10
 
+    def test_putt_rolls_on_ground(self):
+        """Putter shots should roll along the ground with no carry."""
+        cd = ClubData(8.0, 0.0, 0.0, 0.0, "Putter")
+        launch, trajectory = compute_shot(cd)
+
+        assert trajectory.carry_yards == 0
+        assert trajectory.apex_yards == 0
+        assert 5 < trajectory.total_yards < 30
+        assert all(p[1] == 0.0 for p in trajectory.points)
+        assert trajectory.points[-1][2] == pytest.approx(
+            trajectory.total_yards, abs=0.2
+        )
+
     def test_shot_with_wind(self):
         """Full pipeline should accept wind parameters."""
         cd = ClubData(90.0, 0.0, 0.0, 0.0, "7-Iron")
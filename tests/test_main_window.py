@@ -0,0 +1,67 @@
+"""
+Tests for the main window's data handling.
+
+Skipped where QtWebEngine is unavailable (the window embeds the
+Three.js visualizer).
+"""
+
+from collections import deque
+
+import pytest
+
+pytest.importorskip("PyQt6.QtWebEngineWidgets")
+
+from src.main_window import MAX_HISTORY_SHOTS, MainWindow
+from src.models.session import Session
+from src.models.shot import ClubData, Shot
+
+
+def _make_window():
+    """Create a MainWindow with just the shot state, no widgets."""
+    window = MainWindow.__new__(MainWindow)
+    window.session = Session()
+    window.shots = deque(maxlen=MAX_HISTORY_SHOTS)
+    window._shot_count = 0
+    return window
+
+
+def _record(window, shot):
+    """Record a shot the way _on_swing_detected does."""
+    window.session.add_shot(shot)
+    window.shots.append(shot)
+    window._shot_count += 1
+
+
+class TestCsvExport:
+    """Test the rows written by Export CSV."""
+
+    def test_export_includes_shots_beyond_history_cap(self):
+        """Shots dropped from the history list should still be exported."""
+        window = _make_window()
+        n = MAX_HISTORY_SHOTS + 25
+        for i in range(n):
+            _record(window, Shot(club_data=ClubData(80.0 + i % 10, 0.0, 0.0,
+                                                    0.0, "7-Iron")))
+
+        rows = window._export_rows()
+
+        assert len(window.shots) == MAX_HISTORY_SHOTS
+        assert len(rows) == n
+        assert [row[0] for row in rows] == list(range(1, n + 1))
+        assert rows[0][2] == 80.0
+
+    def test_export_starts_after_clear(self):
+        """Clearing the history should restart the export at shot 1."""
+        window = _make_window()
+        for _ in range(3):
+            _record(window, Shot(club_data=ClubData(80.0, 0.0, 0.0, 0.0,
+                                                    "7-Iron")))
+        window.shots.clear()
+        window._shot_count = 0
+        _record(window, Shot(club_data=ClubData(95.0, 0.0, 0.0, 0.0,
+                                                "Driver")))
+
+        rows = window._export_rows()
+
+        assert len(rows) == 1
+        assert rows[0][:3] == (1, "Driver", 95.0)